@@ -0,0 +1,111 @@
+from django.apps import apps
+from django.db import connection
+
+from app.models import models as m
+
+DEFAULT_VOLUMES = {
+    'languages': 2,
+    'menus': 10,
+    'submenus': 5,
+    'tertiaries': 3,
+    'categories': 5,
+    'product_types': 4,
+    'products': 10,
+    'cta': 5,
+    'slides': 5,
+}
+
+
+def create_tables():
+    """Create the unmanaged content tables missing from the current (test) database."""
+    existing = set(connection.introspection.table_names())
+    with connection.schema_editor() as editor:
+        for model in apps.get_app_config('app').get_models():
+            if model._meta.db_table not in existing:
+                editor.create_model(model)
+
+
+def _translate(model, parent_field, parents, languages):
+    model.objects.bulk_create([
+        model(**{parent_field: parent, 'language': language, 'label': '%s %s %s' % (
+            model.__name__, parent.pk, language.lang_code)})
+        for parent in parents for language in languages
+    ])
+
+
+def generate_content(volumes=None):
+    """Fill the content tables with synthetic rows; returns the volumes used."""
+    v = dict(DEFAULT_VOLUMES, **(volumes or {}))
+    codes = ['mn', 'en', 'ru', 'zh', 'ko', 'ja', 'de', 'fr']
+    languages = m.Language.objects.bulk_create([
+        m.Language(lang_code=codes[i] if i < len(codes) else 'l%d' % i, lang_name='Language %d' % i)
+        for i in range(v['languages'])
+    ])
+
+    header = m.Header.objects.create(logo='/logo.svg', active=1)
+    m.HeaderStyle.objects.create(header=header, bgcolor='#fff', fontcolor='#000', height=80, sticky=1)
+    menus = m.HeaderMenu.objects.bulk_create([
+        m.HeaderMenu(header=header, font=1, path='/menu-%d' % i, index=i, visible=1)
+        for i in range(v['menus'])
+    ])
+    _translate(m.HeaderMenuTranslation, 'menu', menus, languages)
+    submenus = m.HeaderSubmenu.objects.bulk_create([
+        m.HeaderSubmenu(header_menu=menu, font=1, path='%s/%d' % (menu.path, i), index=i, visible=1)
+        for menu in menus for i in range(v['submenus'])
+    ])
+    _translate(m.HeaderSubmenuTranslation, 'submenu', submenus, languages)
+    tertiaries = m.HeaderTertiaryMenu.objects.bulk_create([
+        m.HeaderTertiaryMenu(header_submenu=submenu, font='1', path='%s/%d' % (submenu.path, i), index=i, visible=1)
+        for submenu in submenus for i in range(v['tertiaries'])
+    ])
+    _translate(m.HeaderTertiaryMenuTranslation, 'tertiary_menu', tertiaries, languages)
+
+    m.HeroSlider.objects.bulk_create([
+        m.HeroSlider(type='image', file='/uploads/slide-%d.jpg' % i, time=5, index=i, visible=True)
+        for i in range(v['slides'])
+    ])
+    ctas = m.Cta.objects.bulk_create([
+        m.Cta(file='/uploads/cta-%d.png' % i, index=i, font='Inter', color='#333', number=str(i))
+        for i in range(v['cta'])
+    ])
+    _translate(m.CtaTitle, 'cta', ctas, languages)
+    _translate(m.CtaSubtitle, 'cta', ctas, languages)
+
+    app_download = m.AppDownload.objects.create(
+        image='/uploads/app.png', appstore='https://apps.apple.com', playstore='https://play.google.com',
+        title_position=1, divide=1, font='Inter',
+    )
+    lists = m.AppDownloadList.objects.bulk_create([m.AppDownloadList(app_download=app_download) for _ in range(4)])
+    _translate(m.AppDownloadListTranslation, 'app_download_list', lists, languages)
+    titles = m.AppDownloadTitle.objects.bulk_create([m.AppDownloadTitle(app_download=app_download) for _ in range(2)])
+    _translate(m.AppDownloadTitleTranslation, 'app_download_title', titles, languages)
+    m.AppDownloadTitlePosition.objects.bulk_create([
+        m.AppDownloadTitlePosition(app_download_title=title, top=10, left=10, rotate=0, size=32)
+        for title in titles
+    ])
+
+    footer = m.Footer.objects.create(logotext='Bichil', facebook='fb', instagram='ig', twitter='x', titlesize=16, fontsize=14)
+    m.FooterTranslations.objects.bulk_create([
+        m.FooterTranslations(footer=footer, language=language, description='About', location='Ulaanbaatar', copyright='(c)')
+        for language in languages
+    ])
+
+    categories = m.Category.objects.bulk_create([m.Category() for _ in range(v['categories'])])
+    _translate(m.CategoryTranslations, 'category', categories, languages)
+    product_types = m.ProductType.objects.bulk_create([
+        m.ProductType(category=category) for category in categories for _ in range(v['product_types'])
+    ])
+    _translate(m.ProductTypeTranslations, 'product_type', product_types, languages)
+    products = m.Product.objects.bulk_create([
+        m.Product(product_type=product_type) for product_type in product_types for _ in range(v['products'])
+    ])
+    _translate(m.ProductTranslations, 'product', products, languages)
+    m.ProductDetails.objects.bulk_create([
+        m.ProductDetails(
+            product=product, amount=1000000 * (1 + i % 50), min_fee_percent=0.5, max_fee_percent=2,
+            min_interest_rate=1.5 + (i % 10) / 10, max_interest_rate=3 + (i % 10) / 10,
+            term_months=6 * (1 + i % 10), min_processing_hours=1, max_processing_hoyrs=48,
+        )
+        for i, product in enumerate(products)
+    ])
+    return v
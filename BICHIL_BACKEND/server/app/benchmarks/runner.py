@@ -0,0 +1,128 @@
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from app.middleware import RequestMetrics, request_metrics
+from app.models.models import Language
+from app.testing import API_PREFIX, registered_viewsets
+from app.utils.cache import get_content_cache
+
+EXTRA_ENDPOINTS = ('bootstrap/', 'async/bootstrap/', 'categories/catalog/')
+
+
+def _percentile(samples, percent):
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[percent - 1]
+
+
+def measure(func, iterations, warm=False):
+    """Time ``func`` ``iterations`` times; returns latency, query and allocation stats."""
+    timings = []
+    queries = 0
+    for i in range(iterations):
+        if not warm:
+            get_content_cache().reset()
+        # Async reads run some queries on worker threads' connections, which
+        # report to request_metrics rather than to this thread's connection.
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        try:
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                result = func()
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            request_metrics.reset(token)
+        queries = len(captured) + metrics.queries
+
+    if not warm:
+        get_content_cache().reset()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'p50_ms': round(_percentile(timings, 50), 3),
+        'p95_ms': round(_percentile(timings, 95), 3),
+        'queries': queries,
+        'peak_alloc_kb': round(peak / 1024, 1),
+        'status': getattr(result, 'status_code', None),
+    }
+
+
+def read_endpoints():
+    """(name, url) for every list/retrieve route plus the aggregate endpoints."""
+    endpoints = []
+    for prefix, viewset, basename in registered_viewsets():
+        endpoints.append(('%s-list' % basename, '%s%s/' % (API_PREFIX, prefix)))
+        instance = viewset.queryset.model.objects.order_by('pk').first()
+        if instance is not None:
+            endpoints.append(('%s-detail' % basename, '%s%s/%s/' % (API_PREFIX, prefix, instance.pk)))
+    for path in EXTRA_ENDPOINTS:
+        endpoints.append((path.strip('/').replace('/', '-'), API_PREFIX + path))
+    return endpoints
+
+
+def write_cases():
+    """(name, serializer class, payload) for the write serializers."""
+    from app.categories.serializers.write import CategoryWriteSerializer
+    from app.serializers.cta import CtaSerializer
+    from app.serializers.footer import FooterSerializer
+    from app.serializers.headersMenu import HeaderMenuSerializer
+
+    language_ids = list(Language.objects.order_by('id').values_list('id', flat=True))
+    labels = [{'language': pk, 'label': 'Label %d' % pk} for pk in language_ids]
+    return [
+        ('category-write', CategoryWriteSerializer, {'translations': labels}),
+        ('cta-write', CtaSerializer, {
+            'file': '/uploads/cta.png', 'index': 0, 'titles': labels, 'subtitles': labels,
+        }),
+        ('footer-write', FooterSerializer, {'logotext': 'Bichil', 'translations': [
+            {'language_id': pk, 'description': 'd', 'location': 'l', 'copyright': 'c'} for pk in language_ids
+        ]}),
+        ('header-menu-write', HeaderMenuSerializer, {'path': '/bench', 'index': 0, 'translations': labels}),
+    ]
+
+
+def _save(serializer_class, payload):
+    with transaction.atomic():
+        serializer = serializer_class(data=payload)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        transaction.set_rollback(True)
+
+
+def run_benchmarks(iterations=20, warm=False):
+    client = APIClient()
+    results = {'reads': {}, 'writes': {}}
+    for name, url in read_endpoints():
+        results['reads'][name] = dict(measure(lambda: client.get(url), iterations, warm), url=url)
+    for name, serializer_class, payload in write_cases():
+        results['writes'][name] = measure(lambda: _save(serializer_class, payload), iterations, warm=True)
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Regressions of ``results`` against ``baseline``: slower p95, more queries or slower startup."""
+    regressions = []
+    for group in ('reads', 'writes'):
+        for name, current in results.get(group, {}).items():
+            previous = baseline.get(group, {}).get(name)
+            if previous is None:
+                continue
+            if current['queries'] > previous['queries']:
+                regressions.append('%s: %d queries (baseline %d)' % (name, current['queries'], previous['queries']))
+            if current['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+                regressions.append('%s: p95 %.3fms (baseline %.3fms)' % (name, current['p95_ms'], previous['p95_ms']))
+    for entry_point, current in results.get('startup', {}).items():
+        for key, value in current.items():
+            previous = baseline.get('startup', {}).get(entry_point, {}).get(key)
+            if previous is not None and value > previous * (1 + tolerance):
+                regressions.append('%s: %s %.3fms (baseline %.3fms)' % (entry_point, key, value, previous))
+    return regressions
@@ -0,0 +1,138 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from app.models.models import ProductDetails
+
+# ProductDetails rates and fees are percentages; rates are per month, as
+# they are quoted on the site.
+RATE_BOUNDS = (('min', 'min_interest_rate'), ('max', 'max_interest_rate'))
+MAX_TERMS = 12
+MAX_DETAILS = 50
+MAX_TERM_MONTHS = 600
+
+
+def _money(value):
+    return round(value, 2) + 0.0
+
+
+def _annuity_numpy(principal, rates, terms, schedule):
+    r = numpy.asarray(rates, dtype=float) / 100
+    n = numpy.asarray(terms, dtype=float)
+    growth = numpy.power(1 + r, n)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        payment = numpy.where(r == 0, principal / n, principal * r * growth / (growth - 1))
+    totals = payment * n
+    if not schedule:
+        return payment.tolist(), totals.tolist(), None
+
+    # Remaining balance after month k, for every case at once (cases x months).
+    months = numpy.arange(0, int(n.max()) + 1, dtype=float)
+    g = numpy.power(1 + r[:, None], months[None, :])
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        balance = numpy.where(
+            r[:, None] == 0,
+            principal - payment[:, None] * months[None, :],
+            principal * g - payment[:, None] * (g - 1) / r[:, None],
+        )
+    interest = balance[:, :-1] * r[:, None]
+    principal_paid = numpy.round(payment[:, None] - interest, 2) + 0.0
+    interest = numpy.round(interest, 2) + 0.0
+    # Float noise on the last month.
+    balance = numpy.round(numpy.where(numpy.abs(balance) < 0.005, 0.0, balance), 2) + 0.0
+    return payment.tolist(), totals.tolist(), [
+        (principal_paid[i, :term].tolist(), interest[i, :term].tolist(), balance[i, 1:term + 1].tolist())
+        for i, term in enumerate(int(term) for term in terms)
+    ]
+
+
+def _annuity_python(principal, rates, terms, schedule):
+    payments, totals, schedules = [], [], [] if schedule else None
+    for rate, term in zip(rates, terms):
+        r = rate / 100
+        if r == 0:
+            payment = principal / term
+        else:
+            growth = (1 + r) ** term
+            payment = principal * r * growth / (growth - 1)
+        payments.append(payment)
+        totals.append(payment * term)
+        if schedule:
+            principal_paid, interest, balances, balance = [], [], [], principal
+            for _ in range(term):
+                principal_paid.append(_money(payment - balance * r))
+                interest.append(_money(balance * r))
+                balance = balance * (1 + r) - payment
+                balances.append(_money(balance) if abs(balance) >= 0.005 else 0.0)
+            schedules.append((principal_paid, interest, balances))
+    return payments, totals, schedules
+
+
+def amortize(principal, rates, terms, schedule=False):
+    """Annuity payment, total paid and optionally the schedule for each (rate, term) case.
+
+    Schedules list the principal, interest and remaining balance per month.
+
+    All cases are computed in one vectorized NumPy pass when NumPy is
+    installed, otherwise with plain Python arithmetic.
+    """
+    if not rates:
+        return []
+    calculate = _annuity_numpy if numpy is not None else _annuity_python
+    payments, totals, schedules = calculate(float(principal), [float(rate) for rate in rates], terms, schedule)
+    results = []
+    for i, (payment, total) in enumerate(zip(payments, totals)):
+        result = {
+            'monthly_payment': _money(payment),
+            'total_payment': _money(total),
+            'total_interest': _money(total - float(principal)),
+        }
+        if schedules is not None:
+            # Columnar, month 1 first; the payment is the same every month.
+            principal_paid, interest, balances = schedules[i]
+            result['schedule'] = {'principal': principal_paid, 'interest': interest, 'balance': balances}
+        results.append(result)
+    return results
+
+
+def calculate_repayments(amount, terms, detail_ids, schedule=False):
+    """Payments at the min and max rate of each ProductDetails row, for every term.
+
+    One query for the details; every (row, term, rate) case is then
+    amortized in a single batch.
+    """
+    rows = list(
+        ProductDetails.objects.filter(pk__in=detail_ids).order_by('id').values(
+            'id', 'product', 'min_fee_percent', 'max_fee_percent', 'min_interest_rate', 'max_interest_rate',
+        )
+    )
+    cases = [
+        (row, term, bound, row[field])
+        for row in rows for term in terms for bound, field in RATE_BOUNDS
+        if row[field] is not None
+    ]
+    amounts = amortize(amount, [rate for _, _, _, rate in cases], [term for _, term, _, _ in cases], schedule)
+
+    results = {
+        (row['id'], term): {
+            'details': row['id'],
+            'product': row['product'],
+            'term_months': term,
+            'fee': {
+                bound: _money(float(amount) * float(row[field]) / 100) if row[field] is not None else None
+                for bound, field in (('min', 'min_fee_percent'), ('max', 'max_fee_percent'))
+            },
+            'rates': {},
+        }
+        for row in rows for term in terms
+    }
+    for (row, term, bound, rate), result in zip(cases, amounts):
+        results[row['id'], term]['rates'][bound] = dict(rate=str(rate), **result)
+
+    found = {row['id'] for row in rows}
+    return {
+        'amount': str(amount),
+        'results': list(results.values()),
+        'missing': [pk for pk in detail_ids if pk not in found],
+    }
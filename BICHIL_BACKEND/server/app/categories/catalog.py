@@ -0,0 +1,54 @@
+from app.models.models import (
+    Category, CategoryTranslations, Product, ProductTranslations,
+    ProductType, ProductTypeTranslations,
+)
+
+CATALOG_MODELS = (
+    Category, CategoryTranslations, ProductType, ProductTypeTranslations,
+    Product, ProductTranslations,
+)
+
+
+def _translations(model, parent_field, language):
+    queryset = model.objects.all()
+    if language is not None:
+        queryset = queryset.filter(language=language)
+    grouped = {}
+    for parent_id, language_id, label in queryset.order_by('id').values_list(parent_field, 'language', 'label'):
+        grouped.setdefault(parent_id, []).append({'language': language_id, 'label': label})
+    return grouped
+
+
+def build_catalog(language=None):
+    """Category -> product type -> product tree in six flat queries.
+
+    The shape matches CategoryReadSerializer; ``language`` limits every
+    translation list to one language.
+    """
+    category_translations = _translations(CategoryTranslations, 'category', language)
+    type_translations = _translations(ProductTypeTranslations, 'product_type', language)
+    product_translations = _translations(ProductTranslations, 'product', language)
+
+    products = {}
+    for product_id, type_id in Product.objects.order_by('id').values_list('id', 'product_type'):
+        products.setdefault(type_id, []).append({
+            'id': product_id,
+            'translations': product_translations.get(product_id, []),
+        })
+
+    product_types = {}
+    for type_id, category_id in ProductType.objects.order_by('id').values_list('id', 'category'):
+        product_types.setdefault(category_id, []).append({
+            'id': type_id,
+            'translations': type_translations.get(type_id, []),
+            'products': products.get(type_id, []),
+        })
+
+    return [
+        {
+            'id': category_id,
+            'translations': category_translations.get(category_id, []),
+            'product_types': product_types.get(category_id, []),
+        }
+        for category_id in Category.objects.order_by('id').values_list('id', flat=True)
+    ]
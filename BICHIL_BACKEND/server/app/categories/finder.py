@@ -0,0 +1,94 @@
+from django.db.models import F
+
+from app.models.models import (
+    CategoryTranslations, Product, ProductDetails, ProductTranslations, ProductType,
+    ProductTypeTranslations,
+)
+
+FINDER_MODELS = (
+    ProductDetails, Product, ProductTranslations, ProductType, ProductTypeTranslations,
+    CategoryTranslations,
+)
+
+# sort name -> ordering; every one ends on id so pages are stable.
+SORTS = {
+    'rate': (F('min_interest_rate').asc(nulls_last=True), 'id'),
+    'fee': (F('min_fee_percent').asc(nulls_last=True), 'id'),
+    'amount': (F('amount').desc(nulls_last=True), 'id'),
+    'term': (F('term_months').desc(nulls_last=True), 'id'),
+    'processing': (F('min_processing_hours').asc(nulls_last=True), 'id'),
+}
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+DECIMAL_FIELDS = ('amount', 'min_fee_percent', 'max_fee_percent', 'min_interest_rate', 'max_interest_rate')
+DETAIL_FIELDS = DECIMAL_FIELDS + ('term_months', 'min_processing_hours', 'max_processing_hoyrs')
+
+
+def _labels(model, parent_field, parent_ids, language):
+    queryset = model.objects.filter(**{'%s__in' % parent_field: parent_ids})
+    if language is not None:
+        queryset = queryset.filter(language=language)
+    grouped = {}
+    for parent_id, language_id, label in queryset.order_by('id').values_list(parent_field, 'language', 'label'):
+        grouped.setdefault(parent_id, []).append({'language': language_id, 'label': label})
+    return grouped
+
+
+def find_products(amount=None, term=None, max_rate=None, category=None, product_type=None,
+                  sort='rate', limit=DEFAULT_LIMIT, language=None):
+    """Products with a ProductDetails row covering the request, best row first.
+
+    A row matches when it lends at least ``amount``, for at least ``term``
+    months, starting at or below ``max_rate``. The filters are plain range
+    predicates on product_details (see admin/migrations/002_product_finder_indexes.sql);
+    rows stream in ``sort`` order and reading stops after ``limit`` distinct
+    products. Translations then take one query per level: four in total.
+    """
+    details = ProductDetails.objects.all()
+    if amount is not None:
+        details = details.filter(amount__gte=amount)
+    if term is not None:
+        details = details.filter(term_months__gte=term)
+    if max_rate is not None:
+        details = details.filter(min_interest_rate__lte=max_rate)
+    if product_type is not None:
+        details = details.filter(product__product_type=product_type)
+    if category is not None:
+        details = details.filter(product__product_type__category=category)
+    rows = details.exclude(product=None).order_by(*SORTS[sort]).values_list(
+        'product', 'product__product_type', 'product__product_type__category', *DETAIL_FIELDS,
+    )
+
+    matches = {}
+    for product_id, type_id, category_id, *values in rows.iterator(chunk_size=limit * 4):
+        if product_id in matches:
+            continue
+        matches[product_id] = (type_id, category_id, values)
+        if len(matches) == limit:
+            break
+    if not matches:
+        return []
+
+    product_labels = _labels(ProductTranslations, 'product', list(matches), language)
+    type_ids = {type_id for type_id, _, _ in matches.values() if type_id is not None}
+    type_labels = _labels(ProductTypeTranslations, 'product_type', type_ids, language)
+    category_ids = {category_id for _, category_id, _ in matches.values() if category_id is not None}
+    category_labels = _labels(CategoryTranslations, 'category', category_ids, language)
+
+    results = []
+    for product_id, (type_id, category_id, values) in matches.items():
+        details = dict(zip(DETAIL_FIELDS, values))
+        # Decimals as strings, like DRF's DecimalField.
+        for field in DECIMAL_FIELDS:
+            if details[field] is not None:
+                details[field] = str(details[field])
+        results.append({
+            'id': product_id,
+            'translations': product_labels.get(product_id, []),
+            'product_type': {'id': type_id, 'translations': type_labels.get(type_id, [])},
+            'category': {'id': category_id, 'translations': category_labels.get(category_id, [])},
+            'details': details,
+        })
+    return results
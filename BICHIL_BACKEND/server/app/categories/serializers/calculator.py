@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+from app.categories.calculator import MAX_DETAILS, MAX_TERM_MONTHS, MAX_TERMS
+
+
+class RepaymentQuerySerializer(serializers.Serializer):
+    amount = serializers.DecimalField(max_digits=20, decimal_places=2, min_value=0)
+    terms = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=MAX_TERM_MONTHS),
+        min_length=1, max_length=MAX_TERMS,
+    )
+    details = serializers.ListField(
+        child=serializers.IntegerField(), min_length=1, max_length=MAX_DETAILS,
+    )
+    schedule = serializers.BooleanField(default=False)
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from app.categories.finder import DEFAULT_LIMIT, MAX_LIMIT, SORTS
+
+
+class ProductFinderQuerySerializer(serializers.Serializer):
+    amount = serializers.DecimalField(max_digits=20, decimal_places=2, min_value=0, required=False)
+    term = serializers.IntegerField(min_value=0, required=False)
+    max_rate = serializers.DecimalField(max_digits=9, decimal_places=4, min_value=0, required=False)
+    category = serializers.IntegerField(required=False)
+    product_type = serializers.IntegerField(required=False)
+    sort = serializers.ChoiceField(choices=sorted(SORTS), default='rate')
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_LIMIT, default=DEFAULT_LIMIT)
@@ -1,5 +1,7 @@
 from rest_framework import serializers
-from app.models.models import Category, CategoryTranslations, ProductType, Product, ProductTranslations
+from app.models.models import (
+    Category, CategoryTranslations, ProductType, ProductTypeTranslations, Product, ProductTranslations,
+)
 
 class CategoryTranslationReadSerializer(serializers.ModelSerializer):
     class Meta:
@@ -11,6 +13,11 @@ class ProductTranslationReadSerializer(serializers.ModelSerializer):
         model = ProductTranslations
         fields = ['language', 'label']
 
+class ProductTypeTranslationReadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProductTypeTranslations
+        fields = ['language', 'label']
+
 class ProductReadSerializer(serializers.ModelSerializer):
     translations = ProductTranslationReadSerializer(
         source='producttranslations_set', many=True, read_only=True
@@ -24,11 +31,9 @@ class ProductTypeReadSerializer(serializers.ModelSerializer):
     products = ProductReadSerializer(
         source='product_set', many=True, read_only=True
     )
-    translations = serializers.SerializerMethodField()
-
-    def get_translations(self, obj):
-        translations = obj.producttypetranslations_set.all()
-        return [{"language": t.language.id, "label": t.label} for t in translations]
+    translations = ProductTypeTranslationReadSerializer(
+        source='producttypetranslations_set', many=True, read_only=True
+    )
 
     class Meta:
         model = ProductType
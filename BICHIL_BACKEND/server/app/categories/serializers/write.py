@@ -1,7 +1,14 @@
+from django.db import transaction
 from rest_framework import serializers
 from app.models.models import Category, CategoryTranslations
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
+
+class CategoryTranslationWriteSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
 
-class CategoryTranslationWriteSerializer(serializers.ModelSerializer):
     class Meta:
         model = CategoryTranslations
         fields = ['language', 'label']
@@ -13,21 +20,21 @@ class CategoryWriteSerializer(serializers.ModelSerializer):
         model = Category
         fields = ['translations']
 
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('translations', [])
         category = Category.objects.create()  
-        for trans in translations_data:
-            CategoryTranslations.objects.create(category=category, **trans)
+        sync_translations(CategoryTranslations, 'category', category, translations_data, new_parent=True)
+        bump_content_version(Category, CategoryTranslations)
         return category
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('translations', [])
         
-        CategoryTranslations.objects.filter(category=instance).delete()
-
-        for trans in translations_data:
-            CategoryTranslations.objects.create(category=instance, **trans)
+        sync_translations(CategoryTranslations, 'category', instance, translations_data)
         
+        bump_content_version(Category, CategoryTranslations)
         return instance
     
     def to_representation(self, instance):
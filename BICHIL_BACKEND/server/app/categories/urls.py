@@ -1,7 +1,6 @@
-from rest_framework.routers import DefaultRouter
-from app.categories.views import CategoryViewSet
+from app.utils.routing import LazyRouter
 
-router = DefaultRouter()
-router.register(r"categories", CategoryViewSet, basename="category")
+router = LazyRouter()
+router.register(r"categories", "app.categories.views.CategoryViewSet", basename="category")
 
 urlpatterns = router.urls
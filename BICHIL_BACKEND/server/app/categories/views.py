@@ -1,12 +1,58 @@
-from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from app.views.base import ContentViewSet
 from app.models.models import Category
+from app.categories.calculator import calculate_repayments
+from app.categories.catalog import CATALOG_MODELS, build_catalog
+from app.categories.finder import FINDER_MODELS, find_products
+from app.categories.serializers.calculator import RepaymentQuerySerializer
+from app.categories.serializers.finder import ProductFinderQuerySerializer
 from app.categories.serializers.read import CategoryReadSerializer
 from app.categories.serializers.write import CategoryWriteSerializer
+from app.utils.cache import model_versions
+from app.utils.conditional import versioned_response
+from app.utils.language import negotiate_language
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ContentViewSet):
     queryset = Category.objects.all()
+    query_budget = {'list': 6, 'retrieve': 6}
 
     def get_serializer_class(self):
         if self.action in ['list', 'retrieve']:
             return CategoryReadSerializer
         return CategoryWriteSerializer
+
+    @action(detail=False, methods=['get'])
+    def catalog(self, request):
+        language = negotiate_language(request)
+        return versioned_response(
+            request, 'catalog', language, model_versions(CATALOG_MODELS),
+            lambda: build_catalog(language),
+        )
+
+    @action(detail=False, methods=['get'])
+    def finder(self, request):
+        query = ProductFinderQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        language = negotiate_language(request)
+        return versioned_response(
+            request, 'finder:%r' % sorted(params.items()), language, model_versions(FINDER_MODELS),
+            lambda: find_products(language=language, **params),
+        )
+
+    @action(detail=False, methods=['get'])
+    def calculator(self, request):
+        params = request.query_params
+        query = RepaymentQuerySerializer(data={
+            'amount': params.get('amount'),
+            # ?term=12&term=24 or ?terms=12,24; the same for details.
+            'terms': [v for value in params.getlist('term') + params.getlist('terms') for v in value.split(',') if v],
+            'details': [v for value in params.getlist('details') for v in value.split(',') if v],
+            'schedule': params.get('schedule', False),
+        })
+        query.is_valid(raise_exception=True)
+        data = query.validated_data
+        return Response(calculate_repayments(
+            data['amount'], list(dict.fromkeys(data['terms'])), data['details'], data['schedule'],
+        ))
@@ -0,0 +1,260 @@
+import json
+import logging
+import os
+import re
+from collections import namedtuple
+from itertools import groupby
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# columns are db column names, in index order.
+IndexCandidate = namedtuple('IndexCandidate', ['table', 'columns', 'unique', 'reason'])
+SeqScan = namedtuple('SeqScan', ['table', 'detail'])
+
+MIGRATION_NAME = 'content_indexes'
+
+
+def migrations_dir():
+    return str(getattr(settings, 'SQL_MIGRATIONS_DIR', settings.BASE_DIR.parent.parent / 'admin' / 'migrations'))
+
+
+def _model_candidates(model):
+    table = model._meta.db_table
+    foreign_keys = [field for field in model._meta.concrete_fields if field.many_to_one]
+    parents = [field for field in foreign_keys if field.name != 'language']
+    names = {field.name for field in model._meta.concrete_fields}
+
+    candidates = []
+    if 'language' in names and len(parents) == 1:
+        candidates.append(IndexCandidate(
+            table, (parents[0].column, 'language'), True, 'one %s row per language' % parents[0].name,
+        ))
+    if 'index' in names:
+        leading = (parents[0].column,) if parents else ()
+        candidates.append(IndexCandidate(table, leading + ('index',), False, 'ordering by index'))
+    for field in foreign_keys:
+        if not any(candidate.columns[0] == field.column for candidate in candidates):
+            candidates.append(IndexCandidate(table, (field.column,), False, 'foreign key %s' % field.name))
+    return candidates
+
+
+def _existing_indexes(table):
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    return [
+        (tuple(constraint['columns']), constraint['unique'] or constraint['primary_key'])
+        for constraint in constraints.values()
+        if constraint['columns'] and (constraint['index'] or constraint['unique'] or constraint['primary_key'])
+    ]
+
+
+def _covered(candidate, existing):
+    width = len(candidate.columns)
+    for columns, unique in existing:
+        if candidate.unique:
+            if unique and set(columns) == set(candidate.columns):
+                return True
+        elif columns[:width] == candidate.columns:
+            return True
+    return False
+
+
+def missing_indexes():
+    """Indexes the content queries rely on that the unmanaged tables lack.
+
+    Per model: a unique ``(parent, language)`` index on translation tables,
+    ``(parent, index)`` where rows are ordered by ``index`` and one index
+    per foreign key not already leading another. Indexes that exist in the
+    database (checked by introspection) are left out.
+    """
+    tables = set(connection.introspection.table_names())
+    missing = []
+    for model in apps.get_app_config('app').get_models():
+        if model._meta.db_table not in tables:
+            continue
+        existing = _existing_indexes(model._meta.db_table)
+        missing.extend(
+            candidate for candidate in _model_candidates(model) if not _covered(candidate, existing)
+        )
+    return missing
+
+
+def index_name(candidate):
+    prefix = 'uniq' if candidate.unique else 'idx'
+    return ('%s_%s_%s' % (prefix, candidate.table, '_'.join(candidate.columns)))[:63].lower()
+
+
+def _not_null(candidate):
+    quote = connection.ops.quote_name
+    return ' AND '.join('%s IS NOT NULL' % quote(column) for column in candidate.columns)
+
+
+def duplicate_groups(candidate):
+    """``[(values, ids)]`` of rows sharing the columns of a unique ``candidate``, lowest id first.
+
+    CREATE UNIQUE INDEX fails while any of these exist.
+    """
+    quote = connection.ops.quote_name
+    table = quote(candidate.table)
+    columns = [quote(column) for column in candidate.columns]
+    sql = (
+        'SELECT %(t_columns)s, t.id FROM %(table)s t JOIN ('
+        'SELECT %(columns)s FROM %(table)s WHERE %(not_null)s GROUP BY %(columns)s HAVING COUNT(*) > 1'
+        ') d ON %(join)s ORDER BY %(t_columns)s, t.id'
+    ) % {
+        'table': table,
+        'columns': ', '.join(columns),
+        't_columns': ', '.join('t.%s' % column for column in columns),
+        'not_null': _not_null(candidate),
+        'join': ' AND '.join('t.%s = d.%s' % (column, column) for column in columns),
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+    width = len(columns)
+    return [
+        (values, [row[width] for row in group])
+        for values, group in groupby(rows, key=lambda row: tuple(row[:width]))
+    ]
+
+
+def dedupe(candidate):
+    """Delete all but the lowest id of each duplicate group; returns the deleted ids.
+
+    The lowest id is the row reads and sync_translations already use. Runs
+    in its own transaction and logs every deleted id.
+    """
+    from app.utils.cache import bump_content_version
+
+    model = next(model for model in apps.get_app_config('app').get_models() if model._meta.db_table == candidate.table)
+    with transaction.atomic():
+        ids = [pk for _, group in duplicate_groups(candidate) for pk in group[1:]]
+        if ids:
+            model.objects.filter(pk__in=ids).delete()
+            bump_content_version(model)
+    if ids:
+        logger.warning('Deleted duplicate %s rows for %s: %s', candidate.table, index_name(candidate), ids)
+    return ids
+
+
+def create_index_sql(candidate, concurrently=False):
+    quote = connection.ops.quote_name
+    return 'CREATE %sINDEX %sIF NOT EXISTS %s ON %s (%s);' % (
+        'UNIQUE ' if candidate.unique else '',
+        'CONCURRENTLY ' if concurrently else '',
+        quote(index_name(candidate)),
+        quote(candidate.table),
+        ', '.join(quote(column) for column in candidate.columns),
+    )
+
+
+def render_migration(candidates, duplicates=None):
+    """SQL creating ``candidates``; unique ones with ``duplicates`` are left commented out."""
+    duplicates = duplicates or {}
+    lines = [
+        '-- Indexes for the unmanaged content tables, generated by',
+        '-- `manage.py index_advisor --emit`. `manage.py index_advisor --apply`',
+        '-- builds them with CREATE INDEX CONCURRENTLY instead.',
+    ]
+    for table in sorted({candidate.table for candidate in candidates}):
+        lines.append('')
+        for candidate in candidates:
+            if candidate.table != table:
+                continue
+            lines.append('-- %s' % candidate.reason)
+            if duplicates.get(candidate):
+                lines.append('-- Skipped: %d duplicate groups; resolve them (index_advisor --dedupe) first.' % (
+                    len(duplicates[candidate]),
+                ))
+                lines.append('-- ' + create_index_sql(candidate))
+            else:
+                lines.append(create_index_sql(candidate))
+    return '\n'.join(lines) + '\n'
+
+
+def next_migration_path(directory=None):
+    directory = directory or migrations_dir()
+    numbers = [int(match.group(1)) for match in (re.match(r'(\d+)_', name) for name in os.listdir(directory)) if match]
+    return os.path.join(directory, '%03d_%s.sql' % (max(numbers, default=0) + 1, MIGRATION_NAME))
+
+
+def apply_indexes(candidates):
+    """Create ``candidates`` one statement at a time, without blocking writes on PostgreSQL.
+
+    Unique indexes are skipped while their table holds duplicates. CREATE
+    INDEX CONCURRENTLY cannot run inside a transaction (Django's autocommit
+    runs each statement on its own) and leaves an INVALID index behind when
+    it fails, e.g. on a duplicate written during the build; that index is
+    dropped again. Returns ``(applied statements, [(candidate, reason)])``.
+    """
+    concurrently = connection.vendor == 'postgresql'
+    quote = connection.ops.quote_name
+    applied, skipped = [], []
+    for candidate in candidates:
+        if candidate.unique:
+            groups = duplicate_groups(candidate)
+            if groups:
+                skipped.append((candidate, '%d duplicate groups' % len(groups)))
+                continue
+        statement = create_index_sql(candidate, concurrently)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(statement)
+        except DatabaseError as exc:
+            if concurrently:
+                with connection.cursor() as cursor:
+                    cursor.execute('DROP INDEX CONCURRENTLY IF EXISTS %s' % quote(index_name(candidate)))
+            skipped.append((candidate, str(exc).strip()))
+            continue
+        applied.append(statement)
+    return applied, skipped
+
+
+def collect_queries(client, urls):
+    """``{(sql, params): set of urls}`` for every SELECT the ``urls`` run."""
+    from app.utils.cache import get_content_cache
+
+    queries = {}
+
+    def record(url):
+        def wrapper(execute, sql, params, many, context):
+            if sql.lstrip().upper().startswith('SELECT'):
+                queries.setdefault((sql, tuple(params or ())), set()).add(url)
+            return execute(sql, params, many, context)
+        return wrapper
+
+    for url in urls:
+        get_content_cache().reset()
+        with connection.execute_wrapper(record(url)):
+            client.get(url)
+    return queries
+
+
+def _postgres_scans(plan):
+    if plan.get('Node Type') == 'Seq Scan':
+        yield SeqScan(plan['Relation Name'], plan.get('Filter', ''))
+    for child in plan.get('Plans', ()):
+        yield from _postgres_scans(child)
+
+
+def seq_scans(sql, params):
+    """Full table scans in the plan of one query."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return list(_postgres_scans(plan[0]['Plan']))
+        if connection.vendor == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            return [
+                SeqScan(detail.split()[1].strip('"'), detail)
+                for *_, detail in cursor.fetchall()
+                if detail.startswith('SCAN ') and ' USING ' not in detail
+            ]
+    return []
@@ -0,0 +1,65 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from app.benchmarks.data import DEFAULT_VOLUMES, create_tables, generate_content
+from app.benchmarks.runner import compare, run_benchmarks
+from app.startup import measure_startup
+
+
+class Command(BaseCommand):
+    help = (
+        'Create the content tables in a throwaway test database, fill them with '
+        'synthetic data and time every read endpoint and the write serializers, '
+        'plus the cold start of the WSGI and ASGI entry points.'
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_VOLUMES.items():
+            parser.add_argument('--%s' % name.replace('_', '-'), type=int, default=default, dest=name)
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warm', action='store_true', help='Keep the content cache between iterations.')
+        parser.add_argument('--output', help='Write the JSON report to this file.')
+        parser.add_argument('--baseline', help='Compare against a previously saved report.')
+        parser.add_argument(
+            '--startup-runs', type=int, default=5, help='Fresh interpreters per entry point (0 to skip).',
+        )
+        parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed p95 slowdown (0.2 = 20%%).')
+
+    def handle(self, *args, **options):
+        volumes = {name: options[name] for name in DEFAULT_VOLUMES}
+
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            create_tables()
+            generate_content(volumes)
+            report = {
+                'database': connection.vendor,
+                'volumes': volumes,
+                'iterations': options['iterations'],
+                'warm': options['warm'],
+                **run_benchmarks(options['iterations'], options['warm']),
+            }
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+        if options['startup_runs']:
+            report['startup'] = measure_startup(runs=options['startup_runs'])
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                regressions = compare(report, json.load(f), options['tolerance'])
+            if regressions:
+                raise CommandError('Benchmark regressions:\n  ' + '\n  '.join(regressions))
+            self.stderr.write('No regressions against %s' % options['baseline'])
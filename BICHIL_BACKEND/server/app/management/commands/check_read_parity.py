@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.testing import check_read_parity
+
+
+class Command(BaseCommand):
+    help = 'Check that the FAST_READS values() path renders the same bytes as the read serializers.'
+
+    def handle(self, *args, **options):
+        checked, skipped, mismatches = check_read_parity()
+        for name in skipped:
+            self.stdout.write('skipped %s (no values() equivalent)' % name)
+        if mismatches:
+            raise CommandError('Output differs for: ' + ', '.join('%s [%s]' % pair for pair in mismatches))
+        self.stdout.write(self.style.SUCCESS('%d serializers match: %s' % (len(checked), ', '.join(checked))))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+
+from app.routers import read_replicas
+from app.testing import check_replica_routing
+
+
+class Command(BaseCommand):
+    help = 'Check which databases serve a content read as a plain client, after a write and with replicas down.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='/api/v1/hero-slider/', help='Read endpoint to request.')
+
+    def handle(self, *args, **options):
+        if not read_replicas():
+            raise CommandError('READ_REPLICAS is empty.')
+        setup_test_environment()
+        try:
+            results = check_replica_routing(APIClient(), options['url'])
+        finally:
+            teardown_test_environment()
+
+        failed = False
+        for case, expected, served in results:
+            ok = bool(served) and set(served) <= set(expected)
+            failed = failed or not ok
+            self.stdout.write('%-18s %s (expected %s)%s' % (
+                case, ', '.join(served) or 'no queries', ', '.join(expected), '' if ok else '  FAIL',
+            ))
+        if failed:
+            raise CommandError('Reads were not routed as expected.')
+        self.stdout.write(self.style.SUCCESS('Replica routing OK'))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.media import MEDIA_MODELS, Image, generate_derivatives, media_references, source_digest, source_path
+from app.utils.cache import bump_content_version
+
+
+class Command(BaseCommand):
+    help = 'Generate the responsive image variants of every HeroSlider, CTA and AppDownload image.'
+
+    def handle(self, *args, **options):
+        if Image is None:
+            raise CommandError('Pillow is not installed.')
+        generated = skipped = 0
+        for reference in media_references():
+            path = source_path(reference)
+            digest = source_digest(path) if path is not None else None
+            if digest is None:
+                skipped += 1
+                continue
+            try:
+                manifest = generate_derivatives(path, digest)
+            except Exception as exc:
+                self.stderr.write('%s: %s' % (reference, exc))
+                skipped += 1
+                continue
+            generated += 1
+            self.stdout.write('%s -> %s' % (reference, ', '.join(sorted(manifest['variants']))))
+        if generated:
+            bump_content_version(*MEDIA_MODELS)
+        self.stdout.write(self.style.SUCCESS('Generated variants of %d images, skipped %d' % (generated, skipped)))
@@ -0,0 +1,103 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+
+from app.benchmarks.runner import read_endpoints
+from app.indexes import (
+    apply_indexes, collect_queries, dedupe, duplicate_groups, index_name, missing_indexes, next_migration_path,
+    render_migration, seq_scans,
+)
+from app.models.models import Header
+from app.testing import API_PREFIX
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the queries of every read endpoint, report sequential scans and the '
+        'foreign key, index-ordering and (parent, language) indexes the content tables lack.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--emit', action='store_true', help='Write the missing indexes as the next SQL migration.')
+        parser.add_argument('--output', help='Write the SQL migration to this path instead.')
+        parser.add_argument(
+            '--apply', action='store_true',
+            help='Create the missing indexes now (CREATE INDEX CONCURRENTLY on PostgreSQL).',
+        )
+        parser.add_argument(
+            '--dedupe', action='store_true',
+            help='Delete all but the lowest id of each duplicate group blocking a unique index.',
+        )
+
+    def endpoints(self):
+        urls = [url for _, url in read_endpoints()]
+        header = Header.objects.order_by('pk').first()
+        if header is not None:
+            urls.append('%sheaders/%s/navigation/' % (API_PREFIX, header.pk))
+        return urls
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        try:
+            queries = collect_queries(APIClient(), self.endpoints())
+        finally:
+            teardown_test_environment()
+
+        tables = set(connection.introspection.table_names())
+        scans = {}
+        for (sql, params), urls in queries.items():
+            for scan in seq_scans(sql, params):
+                if scan.table in tables:
+                    entry = scans.setdefault(scan.table, {'queries': 0, 'urls': set(), 'detail': scan.detail})
+                    entry['queries'] += 1
+                    entry['urls'].update(urls)
+
+        missing = missing_indexes()
+        missing_tables = {candidate.table for candidate in missing}
+        self.stdout.write('%d distinct queries, %d tables scanned sequentially' % (len(queries), len(scans)))
+        for table, entry in sorted(scans.items(), key=lambda item: -item[1]['queries']):
+            self.stdout.write('  %-40s %3d queries, %d endpoints%s' % (
+                table, entry['queries'], len(entry['urls']), '' if table in missing_tables else ' (no missing index)',
+            ))
+            if entry['detail']:
+                self.stdout.write('      %s' % entry['detail'])
+
+        self.stdout.write('%d missing indexes' % len(missing))
+        for candidate in missing:
+            self.stdout.write('  %-60s %s' % (index_name(candidate), candidate.reason))
+
+        duplicates = self.report_duplicates(missing)
+        if options['dedupe'] and duplicates:
+            for candidate in duplicates:
+                ids = dedupe(candidate)
+                self.stdout.write('Deleted %d %s rows: %s' % (len(ids), candidate.table, ', '.join(map(str, ids))))
+            duplicates = self.report_duplicates(missing)
+
+        if (options['emit'] or options['output']) and missing:
+            path = options['output'] or next_migration_path()
+            with open(path, 'w') as f:
+                f.write(render_migration(missing, duplicates))
+            self.stdout.write(self.style.SUCCESS('Wrote %s' % path))
+        if options['apply'] and missing:
+            applied, skipped = apply_indexes(missing)
+            for statement in applied:
+                self.stdout.write(statement)
+            for candidate, reason in skipped:
+                self.stderr.write('Skipped %s: %s' % (index_name(candidate), reason))
+            self.stdout.write(self.style.SUCCESS('Created %d indexes, skipped %d' % (len(applied), len(skipped))))
+
+    def report_duplicates(self, missing):
+        """``{candidate: groups}`` for the unique indexes that duplicates currently block."""
+        duplicates = {}
+        for candidate in missing:
+            groups = duplicate_groups(candidate) if candidate.unique else []
+            if not groups:
+                continue
+            duplicates[candidate] = groups
+            self.stdout.write('%s: %d duplicate (%s) groups block %s' % (
+                candidate.table, len(groups), ', '.join(candidate.columns), index_name(candidate),
+            ))
+            for values, ids in groups:
+                self.stdout.write('  %s: ids %s' % (values, ', '.join(map(str, ids))))
+        return duplicates
@@ -0,0 +1,47 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.startup import ENTRY_POINTS, FIRST_REQUEST_PATH, profile_imports
+
+
+class Command(BaseCommand):
+    help = (
+        'Import the WSGI or ASGI entry point in a fresh interpreter under -X importtime '
+        'and report the slowest modules and packages.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entry-point', choices=ENTRY_POINTS, default=ENTRY_POINTS[0])
+        parser.add_argument(
+            '--path', default=FIRST_REQUEST_PATH,
+            help='Resolve this URL after booting, as a first request would. Empty to skip.',
+        )
+        parser.add_argument('--sort', choices=('self', 'cumulative'), default='self')
+        parser.add_argument('--limit', type=int, default=25)
+
+    def handle(self, *args, **options):
+        try:
+            timings, imports = profile_imports(options['entry_point'], options['path'] or None)
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write('%s: boot %.1fms%s (with import timing overhead)' % (
+            options['entry_point'], timings['boot_ms'],
+            ', first request %s %.1fms' % (options['path'], timings['first_request_ms'])
+            if 'first_request_ms' in timings else '',
+        ))
+
+        key = 'self_us' if options['sort'] == 'self' else 'cumulative_us'
+        self.stdout.write('\n%10s %10s  module' % ('self ms', 'cum ms'))
+        for timing in sorted(imports, key=lambda timing: getattr(timing, key), reverse=True)[:options['limit']]:
+            self.stdout.write('%10.1f %10.1f  %s%s' % (
+                timing.self_us / 1000, timing.cumulative_us / 1000, '  ' * timing.depth, timing.module,
+            ))
+
+        packages = Counter()
+        for timing in imports:
+            packages[timing.module.split('.')[0]] += timing.self_us
+        self.stdout.write('\n%10s  package (%d modules)' % ('self ms', len(imports)))
+        for package, self_us in packages.most_common(options['limit']):
+            self.stdout.write('%10.1f  %s' % (self_us / 1000, package))
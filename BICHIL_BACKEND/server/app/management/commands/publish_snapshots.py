@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from app.publish import publish, snapshot_root
+
+
+class Command(BaseCommand):
+    help = 'Render every public read for every language into content-hashed JSON snapshots.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', help='Snapshot directory (defaults to SNAPSHOT_ROOT).')
+
+    def handle(self, *args, **options):
+        root = options['root'] or snapshot_root()
+        manifest = publish(root)
+        count = sum(len(languages) for languages in manifest['snapshots'].values())
+        self.stdout.write(self.style.SUCCESS('Published %d snapshots to %s' % (count, root)))
@@ -0,0 +1,260 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import connection, transaction
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+
+from app.models.models import AppDownload, Cta, HeroSlider
+from app.publish import write_atomic
+from app.utils.cache import bump_content_version
+
+logger = logging.getLogger(__name__)
+
+# (model, field) image references that get a srcset; cached reads of these
+# models are bumped when a derivative set finishes.
+MEDIA_FIELDS = ((HeroSlider, 'file'), (Cta, 'file'), (AppDownload, 'image'))
+MEDIA_MODELS = tuple(model for model, _ in MEDIA_FIELDS)
+
+DERIVATIVE_WIDTHS = (320, 640, 960, 1280, 1920)
+# (Pillow format, extension, MIME type), smallest files first. Formats this
+# Pillow build cannot write (AVIF without libavif) are skipped.
+DERIVATIVE_FORMATS = (
+    ('AVIF', 'avif', 'image/avif'),
+    ('WEBP', 'webp', 'image/webp'),
+    ('JPEG', 'jpg', 'image/jpeg'),
+)
+SAVE_OPTIONS = {
+    'AVIF': {'quality': 60},
+    'WEBP': {'quality': 80, 'method': 4},
+    'JPEG': {'quality': 82, 'optimize': True, 'progressive': True},
+}
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.avif')
+# The admin app saves uploads as public/uploads/<timestamp>-<name>.
+UPLOADS_DIR = 'uploads'
+
+
+def derivatives_enabled():
+    return Image is not None and getattr(settings, 'MEDIA_DERIVATIVES', False)
+
+
+def source_root():
+    return str(getattr(settings, 'MEDIA_SOURCE_ROOT', settings.BASE_DIR.parent.parent / 'admin' / 'public'))
+
+
+def derivatives_root():
+    return str(getattr(settings, 'MEDIA_DERIVATIVES_ROOT', settings.BASE_DIR / 'media' / 'derivatives'))
+
+
+def derivatives_url():
+    return getattr(settings, 'MEDIA_DERIVATIVES_URL', '/api/v1/media/')
+
+
+def derivative_path(filename):
+    return os.path.join(derivatives_root(), filename)
+
+
+def _resolve(root, name):
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, name.lstrip('/')))
+    return path if path.startswith(root + os.sep) else None
+
+
+def source_path(reference):
+    """Local file behind an upload reference such as ``/uploads/123-hero.jpg``.
+
+    None for external URLs, non-image files and paths outside MEDIA_SOURCE_ROOT.
+    """
+    if not reference or '://' in reference or reference.startswith('//'):
+        return None
+    if not reference.lower().endswith(SOURCE_EXTENSIONS):
+        return None
+    return _resolve(source_root(), reference)
+
+
+def upload_path(name):
+    """Local file of ``/uploads/<name>``, None outside the uploads directory."""
+    return _resolve(os.path.join(source_root(), UPLOADS_DIR), name)
+
+
+_digests = {}
+_digest_lock = threading.Lock()
+
+
+def source_digest(path):
+    """Content hash of a source file, re-read only when its mtime or size changes."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _digest_lock:
+        cached = _digests.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(chunk)
+    digest = sha.hexdigest()[:20]
+    with _digest_lock:
+        _digests[path] = (key, digest)
+    return digest
+
+
+def _flatten(image):
+    if image.mode in ('RGB', 'RGBA'):
+        return image
+    if 'A' in image.getbands() or 'transparency' in image.info:
+        return image.convert('RGBA')
+    return image.convert('RGB')
+
+
+def _encode(image, pil_format):
+    if pil_format == 'JPEG' and image.mode == 'RGBA':
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **SAVE_OPTIONS[pil_format])
+    return buffer.getvalue()
+
+
+def generate_derivatives(path, digest):
+    """Write every width/format variant of one source image and its manifest.
+
+    Variants are named ``<digest>-<width>.<ext>``, so existing files are
+    reused and a changed upload never overwrites what clients cached.
+    Widths wider than the source are capped at the source width.
+    """
+    root = derivatives_root()
+    os.makedirs(root, exist_ok=True)
+    Image.init()
+    formats = [entry for entry in DERIVATIVE_FORMATS if entry[0] in Image.SAVE]
+
+    with Image.open(path) as source:
+        image = _flatten(ImageOps.exif_transpose(source))
+        width, height = image.size
+        variants = {mime: [] for _, _, mime in formats}
+        for target in sorted({min(w, width) for w in DERIVATIVE_WIDTHS}):
+            resized = image
+            if target != width:
+                resized = image.resize((target, max(1, round(height * target / width))), Image.LANCZOS)
+            for pil_format, extension, mime in formats:
+                filename = '%s-%d.%s' % (digest, target, extension)
+                if not os.path.exists(os.path.join(root, filename)):
+                    write_atomic(os.path.join(root, filename), _encode(resized, pil_format))
+                variants[mime].append([target, filename])
+
+    manifest = {'width': width, 'height': height, 'variants': variants}
+    write_atomic(os.path.join(root, '%s.json' % digest), json.dumps(manifest).encode())
+    return manifest
+
+
+_srcsets = {}
+_srcset_lock = threading.Lock()
+
+
+def _srcset(digest):
+    """Rendered srcset data of a finished derivative set, or None."""
+    with _srcset_lock:
+        if digest in _srcsets:
+            return _srcsets[digest]
+    try:
+        with open(derivative_path('%s.json' % digest), 'rb') as f:
+            manifest = json.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return None
+    base = derivatives_url()
+    srcset = {
+        'width': manifest['width'],
+        'height': manifest['height'],
+        'sources': {
+            mime: ', '.join('%s%s %dw' % (base, filename, width) for width, filename in variants)
+            for mime, variants in manifest['variants'].items()
+        },
+    }
+    with _srcset_lock:
+        _srcsets[digest] = srcset
+    return srcset
+
+
+def srcset(reference):
+    """``{'width', 'height', 'sources': {mime: srcset}}`` for an image reference.
+
+    None until the derivatives exist; the first request for a new image
+    queues them in the worker pool.
+    """
+    if not derivatives_enabled():
+        return None
+    path = source_path(reference)
+    digest = source_digest(path) if path is not None else None
+    if digest is None:
+        return None
+    data = _srcset(digest)
+    if data is None:
+        _queue(path, digest)
+    return data
+
+
+_executor = None
+_pending = set()
+_failed = set()
+_queue_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'MEDIA_WORKERS', 2), thread_name_prefix='media-derivatives',
+        )
+    return _executor
+
+
+def _run(path, digest):
+    try:
+        generate_derivatives(path, digest)
+        # Cached reads rendered srcset as null while this was running.
+        bump_content_version(*MEDIA_MODELS)
+    except Exception:
+        logger.exception('Generating derivatives of %s failed', path)
+        with _queue_lock:
+            _failed.add(digest)
+    finally:
+        with _queue_lock:
+            _pending.discard(digest)
+        connection.close()
+
+
+def _queue(path, digest):
+    with _queue_lock:
+        if digest in _pending or digest in _failed:
+            return
+        _pending.add(digest)
+        _get_executor().submit(_run, path, digest)
+
+
+def queue_derivatives(*references):
+    """Generate the variants of uploaded images in the background once the write commits."""
+    if derivatives_enabled():
+        for reference in references:
+            transaction.on_commit(partial(srcset, reference), robust=True)
+
+
+def media_references():
+    """Every image reference stored in MEDIA_FIELDS."""
+    references = set()
+    for model, field in MEDIA_FIELDS:
+        references.update(model.objects.exclude(**{'%s__isnull' % field: True}).values_list(field, flat=True))
+    return sorted(references)
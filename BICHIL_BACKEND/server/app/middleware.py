@@ -0,0 +1,215 @@
+import threading
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from app.routers import read_replicas, replica_reads, request_versions, sticky_seconds
+
+
+class RequestMetrics:
+    """Execute wrapper counting queries and DB time for one request.
+
+    Queries may run on several threads at once (see app.views.asyncContent).
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            with self._lock:
+                self.queries += 1
+                self.db_time += time.perf_counter() - start
+
+    def install(self, stack):
+        """Count the queries of this thread's connections until ``stack`` closes."""
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+
+
+# RequestMetrics of the current request, for threads that run its queries on
+# connections of their own.
+request_metrics = ContextVar('request_metrics', default=None)
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def record(route, metrics, total_time, response_bytes):
+    with _stats_lock:
+        entry = _stats.setdefault(route, {
+            'requests': 0, 'queries': 0, 'max_queries': 0, 'db_ms': 0.0,
+            'serializer_ms': 0.0, 'total_ms': 0.0, 'bytes': 0,
+        })
+        entry['requests'] += 1
+        entry['queries'] += metrics.queries
+        entry['max_queries'] = max(entry['max_queries'], metrics.queries)
+        entry['db_ms'] += metrics.db_time * 1000
+        entry['serializer_ms'] += metrics.serializer_time * 1000
+        entry['total_ms'] += total_time * 1000
+        entry['bytes'] += response_bytes
+
+
+def get_stats():
+    """Per-route averages of everything recorded since the process started."""
+    with _stats_lock:
+        stats = {}
+        for route, entry in _stats.items():
+            count = entry['requests']
+            stats[route] = {
+                'requests': count,
+                'avg_queries': round(entry['queries'] / count, 2),
+                'max_queries': entry['max_queries'],
+                'avg_db_ms': round(entry['db_ms'] / count, 3),
+                'avg_serializer_ms': round(entry['serializer_ms'] / count, 3),
+                'avg_total_ms': round(entry['total_ms'] / count, 3),
+                'avg_bytes': round(entry['bytes'] / count),
+            }
+        return stats
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def query_budget_enabled():
+    return getattr(settings, 'QUERY_BUDGET_ENABLED', False)
+
+
+class QueryBudgetMiddleware:
+    """Record query count, DB time, serializer time and bytes per route name.
+
+    Does nothing unless ``QUERY_BUDGET_ENABLED`` is set. The numbers for the
+    current request are also returned in ``X-Query-Count`` and
+    ``Server-Timing`` headers.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _wrap(self, request, stack):
+        metrics = RequestMetrics()
+        request.query_metrics = metrics
+        metrics.install(stack)
+        return metrics
+
+    def _finish(self, request, response, metrics, total_time):
+        match = getattr(request, 'resolver_match', None)
+        route = match.view_name if match is not None else request.path
+        response_bytes = 0 if response.streaming else len(response.content)
+        record(route, metrics, total_time, response_bytes)
+
+        response['X-Query-Count'] = str(metrics.queries)
+        response['Server-Timing'] = 'db;dur=%.2f, serialize;dur=%.2f, total;dur=%.2f' % (
+            metrics.db_time * 1000, metrics.serializer_time * 1000, total_time * 1000,
+        )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not query_budget_enabled():
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            metrics = self._wrap(request, stack)
+            token = request_metrics.set(metrics)
+            try:
+                response = self.get_response(request)
+            finally:
+                request_metrics.reset(token)
+        return self._finish(request, response, metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if not query_budget_enabled():
+            return await self.get_response(request)
+
+        start = time.perf_counter()
+        # Connections are per thread: install the wrappers on the thread the
+        # async ORM runs its queries on.
+        stack = ExitStack()
+        metrics = await sync_to_async(self._wrap)(request, stack)
+        token = request_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_metrics.reset(token)
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, metrics, time.perf_counter() - start)
+
+
+# Cookie pinning a client's reads to the primary after it wrote.
+PRIMARY_PIN_COOKIE = 'read_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReadReplicaMiddleware:
+    """Allow ReadReplicaRouter to use replicas for read-only requests.
+
+    A client that sent a write gets a cookie that keeps its reads on the
+    primary for READ_STICKY_SECONDS, so it reads its own writes. Does
+    nothing unless ``READ_REPLICAS`` is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _use_replica(self, request):
+        return request.method in SAFE_METHODS and PRIMARY_PIN_COOKIE not in request.COOKIES
+
+    def _pin(self, request, response):
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(PRIMARY_PIN_COOKIE, '1', max_age=sticky_seconds(), httponly=True, samesite='Lax')
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not read_replicas():
+            return self.get_response(request)
+
+        token = replica_reads.set(self._use_replica(request))
+        versions_token = request_versions.set({})
+        try:
+            response = self.get_response(request)
+        finally:
+            request_versions.reset(versions_token)
+            replica_reads.reset(token)
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        if not read_replicas():
+            return await self.get_response(request)
+
+        # sync_to_async copies the context, so the ORM thread sees this too.
+        token = replica_reads.set(self._use_replica(request))
+        versions_token = request_versions.set({})
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_versions.reset(versions_token)
+            replica_reads.reset(token)
+        return self._pin(request, response)
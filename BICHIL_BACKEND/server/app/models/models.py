@@ -429,3 +429,14 @@ class ProductTypeTranslations(models.Model):
     class Meta:
         managed = False
         db_table = 'product_type_translations'
+
+
+class ContentVersion(models.Model):
+    # Version of one content type (model label), shared by every worker; see
+    # app.utils.cache.DatabaseVersions.
+    name = models.TextField(primary_key=True)
+    version = models.BigIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'content_version'
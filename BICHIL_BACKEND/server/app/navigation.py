@@ -0,0 +1,225 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+
+from app.models.models import (
+    Header, HeaderMenu, HeaderMenuTranslation, HeaderSubmenu, HeaderSubmenuTranslation,
+    HeaderTertiaryMenu, HeaderTertiaryMenuTranslation,
+)
+from app.utils.cache import bump_content_version
+from app.utils.translations import translations_changed
+
+NAVIGATION_MODELS = (
+    HeaderMenu, HeaderMenuTranslation, HeaderSubmenu, HeaderSubmenuTranslation,
+    HeaderTertiaryMenu, HeaderTertiaryMenuTranslation,
+)
+
+# (node model, parent fk, translation model, translation fk), top level first.
+NAVIGATION_LEVELS = (
+    (HeaderMenu, 'header', HeaderMenuTranslation, 'menu'),
+    (HeaderSubmenu, 'header_menu', HeaderSubmenuTranslation, 'submenu'),
+    (HeaderTertiaryMenu, 'header_submenu', HeaderTertiaryMenuTranslation, 'tertiary_menu'),
+)
+NODE_FIELDS = ('path', 'font', 'index', 'visible')
+# The admin's font for text font columns; integer font columns have no
+# default, so new nodes must name one.
+DEFAULT_FONT = 'font-sans'
+
+
+def default_font(model):
+    field = model._meta.get_field('font')
+    if field.has_default():
+        return field.get_default()
+    return DEFAULT_FONT if field.get_internal_type() == 'TextField' else None
+
+
+def header_lookup(depth):
+    """Lookup from a level-``depth`` node to its header, e.g. ``header_menu__header``."""
+    return '__'.join(reversed([level[1] for level in NAVIGATION_LEVELS[:depth + 1]]))
+
+
+def _labels(model, fk, lookup, header_id, language):
+    queryset = model.objects.filter(**{lookup: header_id})
+    if language is not None:
+        labels = {}
+        for node_id, label in queryset.filter(language=language).order_by('id').values_list(fk, 'label'):
+            labels.setdefault(node_id, label)
+        return labels
+    labels = {}
+    for node_id, language_id, label in queryset.order_by('id').values_list(fk, 'language', 'label'):
+        labels.setdefault(node_id, {}).setdefault(str(language_id), label)
+    return labels
+
+
+def build_navigation(header_id, language=None, hidden=False):
+    """Visible menu -> submenu -> tertiary tree of one header, six flat queries.
+
+    Rows come back sorted by ``(index, id)``, so appending each node to its
+    parent in one pass keeps siblings in order. Hidden (``visible=0``) nodes
+    are dropped together with everything below them, unless ``hidden`` is
+    set; nodes then also carry ``visible``. With a language each node has a
+    ``label``; without one, ``labels`` maps language id to label.
+    """
+    roots = []
+    parents = None
+    for depth, (model, parent_field, translation_model, fk) in enumerate(NAVIGATION_LEVELS):
+        lookup = header_lookup(depth)
+        labels = _labels(translation_model, fk, '%s__%s' % (fk, lookup), header_id, language)
+        rows = model.objects.filter(**{lookup: header_id})
+        if not hidden:
+            rows = rows.exclude(visible=0)
+        rows = rows.order_by(F('index').asc(nulls_first=True), 'id').values_list(
+            'id', parent_field, 'path', 'font', 'index', 'visible',
+        )
+        nodes = {}
+        for node_id, parent_id, path, font, index, visible in rows:
+            if parents is not None and parent_id not in parents:
+                continue
+            node = {'id': node_id, 'path': path, 'font': font, 'index': index}
+            if hidden:
+                node['visible'] = visible
+            if language is not None:
+                node['label'] = labels.get(node_id)
+            else:
+                node['labels'] = labels.get(node_id, {})
+            node['children'] = []
+            nodes[node_id] = node
+            (roots if parents is None else parents[parent_id]['children']).append(node)
+        parents = nodes
+    return roots
+
+
+def _check_ids(tree, existing):
+    """Reject ids that are not nodes of this header's level, or repeat."""
+    errors, seen = [], set()
+    nodes = list(tree)
+    for depth, (model, _, _, _) in enumerate(NAVIGATION_LEVELS):
+        for node in nodes:
+            pk = node.get('id')
+            if pk is None:
+                continue
+            if pk not in existing[depth]:
+                errors.append('%s %s is not part of this header.' % (model.__name__, pk))
+            elif (depth, pk) in seen:
+                errors.append('%s %s appears more than once.' % (model.__name__, pk))
+            seen.add((depth, pk))
+        nodes = [child for node in nodes for child in node.get('children', ())]
+    if errors:
+        raise ValidationError({'navigation': errors})
+
+
+def _sync_labels(translation_model, fk, labelled):
+    """Make the translations of every ``(node id, {language id: label})`` match, level-wide.
+
+    One SELECT, then at most one DELETE, UPDATE and INSERT for the whole
+    level. Returns the ids of nodes whose translations changed.
+    """
+    if not labelled:
+        return set()
+    existing, stale = {}, []
+    rows = translation_model.objects.filter(**{'%s__in' % fk: [pk for pk, _ in labelled]}).order_by('id')
+    for translation_id, node_id, language_id, label in rows.values_list('id', fk, 'language', 'label'):
+        if (node_id, language_id) in existing:
+            stale.append((translation_id, node_id))
+        else:
+            existing[node_id, language_id] = (translation_id, label)
+
+    to_create, to_update, changed = [], [], set()
+    for node_id, labels in labelled:
+        for language_id, label in labels.items():
+            current = existing.pop((node_id, language_id), None)
+            if current is None:
+                to_create.append(translation_model(**{'%s_id' % fk: node_id, 'language_id': language_id, 'label': label}))
+                changed.add(node_id)
+            elif current[1] != label:
+                to_update.append(translation_model(pk=current[0], label=label))
+                changed.add(node_id)
+    # Languages no longer in the labels.
+    stale.extend((translation_id, node_id) for (node_id, _), (translation_id, _) in existing.items())
+    changed.update(node_id for _, node_id in stale)
+
+    if stale:
+        translation_model.objects.filter(pk__in=[translation_id for translation_id, _ in stale]).delete()
+    if to_update:
+        translation_model.objects.bulk_update(to_update, ['label'])
+    if to_create:
+        translation_model.objects.bulk_create(to_create)
+    return changed
+
+
+@transaction.atomic
+def save_navigation(header_id, tree):
+    """Replace the menu tree of one header with ``tree``, in one transaction.
+
+    ``tree`` is validated NavigationMenuSerializer data. Nodes with an ``id``
+    are updated in place (and may move to another parent), nodes without one
+    are inserted, visible, at their position among their siblings and with
+    the level's default font unless the node says otherwise. Stored nodes
+    missing from the tree are deleted with their translations. A node's
+    ``labels`` replace its translations; nodes without ``labels`` keep
+    theirs. Every level is read once and written with bulk statements, so
+    the statement count does not grow with the tree.
+    """
+    # Serialize concurrent saves of the same header.
+    list(Header.objects.select_for_update().filter(pk=header_id).values_list('pk'))
+
+    existing = []
+    for depth, (model, parent_field, _, _) in enumerate(NAVIGATION_LEVELS):
+        rows = model.objects.filter(**{header_lookup(depth): header_id})
+        existing.append({
+            row['id']: row for row in rows.values('id', '%s_id' % parent_field, *NODE_FIELDS)
+        })
+    _check_ids(tree, existing)
+
+    level = [(node, header_id, position) for position, node in enumerate(tree)]
+    kept = []
+    for depth, (model, parent_field, translation_model, fk) in enumerate(NAVIGATION_LEVELS):
+        parent_key = '%s_id' % parent_field
+        to_create, created, to_update = [], [], []
+        for node, parent_id, position in level:
+            values = {field: node[field] for field in NODE_FIELDS if field in node}
+            values[parent_key] = parent_id
+            if node.get('id') is None:
+                defaults = {'visible': 1, 'index': position, 'font': default_font(model)}
+                for field, default in defaults.items():
+                    if values.get(field) is None:
+                        values[field] = default
+                to_create.append(model(**values))
+                created.append(node)
+                continue
+            row = existing[depth][node['id']]
+            if any(row[field] != value for field, value in values.items()):
+                to_update.append(model(**dict(row, **values)))
+
+        model.objects.bulk_create(to_create)
+        for node, obj in zip(created, to_create):
+            node['id'] = obj.pk
+        if to_update:
+            model.objects.bulk_update(to_update, [parent_field, *NODE_FIELDS])
+
+        changed = _sync_labels(translation_model, fk, [
+            (node['id'], node['labels']) for node, _, _ in level if 'labels' in node
+        ])
+        if changed:
+            transaction.on_commit(
+                partial(translations_changed.send, sender=translation_model, parent_ids=sorted(changed)),
+                robust=True,
+            )
+
+        kept.append({node['id'] for node, _, _ in level})
+        level = [
+            (child, node['id'], position)
+            for node, _, _ in level for position, child in enumerate(node.get('children', ()))
+        ]
+
+    # Children first: nodes may have moved away from a deleted parent above.
+    for depth in reversed(range(len(NAVIGATION_LEVELS))):
+        model, _, translation_model, fk = NAVIGATION_LEVELS[depth]
+        stale = [pk for pk in existing[depth] if pk not in kept[depth]]
+        if stale:
+            translation_model.objects.filter(**{'%s__in' % fk: stale}).delete()
+            model.objects.filter(pk__in=stale).delete()
+
+    bump_content_version(*NAVIGATION_MODELS)
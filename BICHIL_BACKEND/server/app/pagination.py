@@ -0,0 +1,114 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Forward keyset pagination on ``(index, id)``, or ``id`` without an index column.
+
+    Requests with ``?cursor=`` or ``?page_size=`` get pages of ``page_size``
+    (PAGE_SIZE by default). Plain list requests, which is how the admin and
+    frontend read whole lists, get up to MAX_PAGE_SIZE rows, so no request
+    reads a table unbounded. A view whose clients need every row regardless
+    can opt out with ``unbounded_list = True``; keep that to tables that stay
+    small. The page body stays a plain list; the next page is advertised in
+    an RFC 8288 ``Link: <...>; rel="next"`` header.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request):
+        max_page_size = getattr(settings, 'MAX_PAGE_SIZE', 500)
+        if not self.requested(request):
+            return max_page_size
+        page_size = api_settings.PAGE_SIZE or 100
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, page_size))
+        except (TypeError, ValueError):
+            pass
+        return max(1, min(page_size, max_page_size))
+
+    def get_key_fields(self, queryset):
+        field_names = {field.name for field in queryset.model._meta.concrete_fields}
+        return ('index', 'id') if 'index' in field_names else ('id',)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(cursor, list) or len(cursor) != len(self.key_fields):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, instance):
+        # Pages of values() rows hold dicts.
+        if isinstance(instance, dict):
+            cursor = [instance[field] for field in self.key_fields]
+        else:
+            cursor = [getattr(instance, field) for field in self.key_fields]
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+    def _after(self, cursor):
+        if len(cursor) == 1:
+            return Q(id__gt=cursor[0])
+        index, pk = cursor
+        # NULL indexes sort first.
+        if index is None:
+            return Q(index__isnull=True, id__gt=pk) | Q(index__isnull=False)
+        return Q(index__gt=index) | Q(index=index, id__gt=pk)
+
+    def requested(self, request):
+        return any(param in request.query_params for param in (self.cursor_query_param, self.page_size_query_param))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.next_cursor = None
+        self.key_fields = self.get_key_fields(queryset)
+        self.page_size = self.get_page_size(request)
+
+        if self.key_fields == ('index', 'id'):
+            queryset = queryset.order_by(F('index').asc(nulls_first=True), 'id')
+        else:
+            queryset = queryset.order_by('id')
+        if not self.requested(request) and getattr(view, 'unbounded_list', False):
+            return list(queryset)
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self._after(cursor))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def set_next_link(self, response, request, next_cursor):
+        """Advertise ``next_cursor`` on ``response``; used for cached pages too."""
+        self.request, self.next_cursor = request, next_cursor
+        next_link = self.get_next_link()
+        if next_link is not None:
+            response['Link'] = '<%s>; rel="next"' % next_link
+        return response
+
+    def get_paginated_response(self, data):
+        return self.set_next_link(Response(data), self.request, self.next_cursor)
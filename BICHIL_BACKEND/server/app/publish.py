@@ -0,0 +1,181 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from app.models.models import Language
+from app.renderers import FastJSONRenderer
+from app.utils.language import ALL_LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+FILES_DIR = 'files'
+
+
+def snapshot_root():
+    return str(getattr(settings, 'SNAPSHOT_ROOT', settings.BASE_DIR / 'snapshots'))
+
+
+def publish_on_write():
+    return getattr(settings, 'PUBLISH_SNAPSHOTS', False)
+
+
+def publish_delay():
+    return getattr(settings, 'PUBLISH_DELAY_SECONDS', 1.0)
+
+
+def snapshot_builders():
+    """name -> build(language) for every public read that gets a snapshot."""
+    from app.categories.catalog import build_catalog
+    from app.views.bootstrap import SECTIONS, build_bootstrap, build_section
+
+    builders = {'bootstrap': build_bootstrap, 'catalog': build_catalog}
+    for key, queryset, serializer_class, many in SECTIONS:
+        builders[key.replace('_', '-')] = partial(build_section, queryset, serializer_class, many)
+    return builders
+
+
+def write_atomic(path, raw):
+    tmp = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+    with open(tmp, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
+
+def _write_snapshot(files_dir, name, lang_code, raw):
+    digest = hashlib.sha256(raw).hexdigest()[:20]
+    filename = '%s.%s.%s.json' % (name, lang_code, digest)
+    path = os.path.join(files_dir, filename)
+    # Content-hashed names never change once written.
+    if not os.path.exists(path):
+        write_atomic(path, raw)
+    return filename, digest
+
+
+def read_manifest(root=None):
+    try:
+        with open(os.path.join(root or snapshot_root(), MANIFEST_NAME), 'rb') as f:
+            return json.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+_manifest_cache = {}
+_manifest_lock = threading.Lock()
+
+
+def current_manifest():
+    """The published manifest, re-read only when the file changes on disk."""
+    path = os.path.join(snapshot_root(), MANIFEST_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _manifest_lock:
+        cached = _manifest_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = _manifest_cache[path] = (mtime, read_manifest(os.path.dirname(path)))
+        return cached[1]
+
+
+def snapshot_path(filename):
+    return os.path.join(snapshot_root(), FILES_DIR, filename)
+
+
+def _referenced(manifest):
+    if not manifest:
+        return set()
+    return {entry['file'] for languages in manifest['snapshots'].values() for entry in languages.values()}
+
+
+def publish(root=None):
+    """Render every snapshot for every language and switch the manifest to them.
+
+    Files referenced by the previous manifest are kept so readers that loaded
+    it just before the switch can still open them; older ones are removed.
+    """
+    root = root or snapshot_root()
+    files_dir = os.path.join(root, FILES_DIR)
+    os.makedirs(files_dir, exist_ok=True)
+
+    languages = [None] + list(Language.objects.order_by('id'))
+    renderer = FastJSONRenderer()
+    snapshots = {}
+    for name, build in snapshot_builders().items():
+        snapshots[name] = {}
+        for language in languages:
+            lang_code = (language.lang_code or '').lower() if language is not None else ALL_LANGUAGES
+            filename, digest = _write_snapshot(files_dir, name, lang_code, renderer.render(build(language)))
+            snapshots[name][lang_code] = {'file': filename, 'etag': digest}
+
+    previous = read_manifest(root)
+    manifest = {'published': int(time.time() * 1000), 'snapshots': snapshots}
+    write_atomic(os.path.join(root, MANIFEST_NAME), json.dumps(manifest, indent=2).encode())
+
+    keep = _referenced(manifest) | _referenced(previous)
+    with os.scandir(files_dir) as it:
+        stale = [entry.path for entry in it if entry.name not in keep and not entry.name.endswith('.tmp')]
+    for path in stale:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    return manifest
+
+
+_executor = None
+_queued = False
+_queue_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # One worker: publishes never overlap.
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot-publish')
+    return _executor
+
+
+def _run():
+    global _queued
+    # Writes committed while this waits are covered by this publish.
+    time.sleep(publish_delay())
+    with _queue_lock:
+        _queued = False
+    try:
+        publish()
+    except Exception:
+        logger.exception('Publishing snapshots failed')
+    finally:
+        connection.close()
+
+
+def queue_publish():
+    """Republish in the background after PUBLISH_DELAY_SECONDS.
+
+    Writes arriving before a queued publish starts share it; a write during
+    a publish queues one more.
+    """
+    global _queued
+    with _queue_lock:
+        if _queued:
+            return
+        _queued = True
+        _get_executor().submit(_run)
+
+
+def schedule_publish():
+    """Queue a republish once the current transaction commits, at most once per transaction."""
+    if not publish_on_write():
+        return
+    if any(callback[1] is queue_publish for callback in connection.run_on_commit):
+        return
+    transaction.on_commit(queue_publish, robust=True)
@@ -0,0 +1,40 @@
+import re
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Floats that orjson formats differently from json: exponent forms (1e16 and
+# 1e-7 against 1e+16 and 1e-07) and 0.000025, which json writes as 2.5e-05. The
+# pattern may also match inside a string; that only costs speed.
+_FLOAT_MISMATCH = re.compile(rb'[0-9]e[-0-9]|0\.0000[1-9]')
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes compact output with orjson when it is installed.
+
+    The bytes match JSONRenderer's compact, non-ASCII-escaped output; indented
+    (browsable) output, anything orjson rejects and floats orjson formats
+    differently go through the stdlib path. NaN and Infinity, which
+    JSONRenderer refuses to encode, are rendered as null.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if _FLOAT_MISMATCH.search(ret):
+            try:
+                return super().render(data, accepted_media_type, renderer_context)
+            except ValueError:
+                pass  # NaN or Infinity; orjson wrote null.
+        # Same as JSONRenderer: keep the output safe to embed in <script>.
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
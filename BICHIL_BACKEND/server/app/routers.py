@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from app.utils.cache import content_type, get_content_cache
+
+# Set by ReadReplicaMiddleware for the duration of a read-only request that
+# is not pinned to the primary. Everything else (writes, admin, management
+# commands, background workers) reads from the primary.
+replica_reads = ContextVar('replica_reads', default=False)
+# content type -> version, memoized for the request by ReadReplicaMiddleware
+# so routing a query does not read the content cache every time.
+request_versions = ContextVar('request_versions', default=None)
+
+_down = {}
+_down_lock = threading.Lock()
+
+
+def read_replicas():
+    return list(getattr(settings, 'READ_REPLICAS', ()))
+
+
+def sticky_seconds():
+    return getattr(settings, 'READ_STICKY_SECONDS', 5)
+
+
+def replica_retry_seconds():
+    return getattr(settings, 'READ_REPLICA_RETRY_SECONDS', 30)
+
+
+def mark_replica_down(alias):
+    with _down_lock:
+        _down[alias] = time.monotonic() + replica_retry_seconds()
+
+
+def mark_replica_up(alias):
+    with _down_lock:
+        _down.pop(alias, None)
+
+
+def _available(alias):
+    with _down_lock:
+        retry_at = _down.get(alias)
+        if retry_at is not None and retry_at > time.monotonic():
+            return False
+        _down.pop(alias, None)
+    try:
+        connections[alias].ensure_connection()
+    except DatabaseError:
+        mark_replica_down(alias)
+        return False
+    return True
+
+
+def recently_written(model):
+    """Whether ``model``'s content version moved within the sticky window.
+
+    Replicas may still lag behind such a write, and a stale read would be
+    cached under the new version. Versions are looked up once per model
+    and request.
+    """
+    name = content_type(model)
+    versions = request_versions.get()
+    if versions is not None and name in versions:
+        version = versions[name]
+    else:
+        version = get_content_cache().get_versions([name])[0]
+        if versions is not None:
+            versions[name] = version
+    return version > (time.time() - sticky_seconds()) * 1000
+
+
+class ReadReplicaRouter:
+    """Send content reads of replica-eligible requests to READ_REPLICAS.
+
+    Reads stay on the primary inside a transaction, for models written
+    within READ_STICKY_SECONDS and when no replica accepts a connection. A
+    replica that fails to connect is skipped for READ_REPLICA_RETRY_SECONDS.
+    Writes always go to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not replica_reads.get() or model._meta.app_label != 'app':
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block or recently_written(model):
+            return DEFAULT_DB_ALIAS
+        replicas = read_replicas()
+        random.shuffle(replicas)
+        for alias in replicas:
+            if _available(alias):
+                return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in read_replicas():
+            return False
+        return None
@@ -0,0 +1,230 @@
+import bisect
+import heapq
+import threading
+import unicodedata
+
+from app.models.models import CategoryTranslations, ProductTranslations, ProductTypeTranslations
+from app.utils.cache import content_type, model_versions
+from app.utils.translations import translations_changed
+
+# translation model -> (result type, parent fk, {result key: lookup} for links)
+SEARCH_SOURCES = {
+    CategoryTranslations: ('category', 'category', {}),
+    ProductTypeTranslations: ('product_type', 'product_type', {'category': 'product_type__category'}),
+    ProductTranslations: ('product', 'product', {
+        'product_type': 'product__product_type',
+        'category': 'product__product_type__category',
+    }),
+}
+
+# pg_trgm's default similarity threshold.
+TRIGRAM_THRESHOLD = 0.3
+MAX_PREFIX_MATCHES = 200
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def normalize(text):
+    """Casefold, strip accents (й -> и, ё -> е, é -> e) and split into words."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return ''.join(char if char.isalnum() else ' ' for char in stripped).split()
+
+
+def trigrams(token):
+    padded = '  %s ' % token
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _LanguageIndex:
+    """Token -> documents, a sorted vocabulary for prefixes and trigram -> tokens."""
+
+    def __init__(self):
+        self.token_docs = {}
+        self.vocabulary = []
+        self.trigram_tokens = {}
+
+    def add(self, key, tokens):
+        for token in tokens:
+            docs = self.token_docs.get(token)
+            if docs is None:
+                docs = self.token_docs[token] = set()
+                bisect.insort(self.vocabulary, token)
+                for trigram in trigrams(token):
+                    self.trigram_tokens.setdefault(trigram, set()).add(token)
+            docs.add(key)
+
+    def remove(self, key, tokens):
+        for token in tokens:
+            docs = self.token_docs.get(token)
+            if docs is None:
+                continue
+            docs.discard(key)
+            if not docs:
+                del self.token_docs[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+                for trigram in trigrams(token):
+                    tokens_for_trigram = self.trigram_tokens[trigram]
+                    tokens_for_trigram.discard(token)
+                    if not tokens_for_trigram:
+                        del self.trigram_tokens[trigram]
+
+    def _candidates(self, word):
+        """token -> score for one query word: exact 1.0, prefix < 1.0, fuzzy < 0.7."""
+        candidates = {}
+        start = bisect.bisect_left(self.vocabulary, word)
+        for token in self.vocabulary[start:start + MAX_PREFIX_MATCHES]:
+            if not token.startswith(word):
+                break
+            candidates[token] = 1.0 if token == word else 0.7 + 0.2 * len(word) / len(token)
+
+        word_trigrams = trigrams(word)
+        shared = {}
+        for trigram in word_trigrams:
+            for token in self.trigram_tokens.get(trigram, ()):
+                shared[token] = shared.get(token, 0) + 1
+        for token, count in shared.items():
+            similarity = count / (len(word_trigrams) + len(trigrams(token)) - count)
+            if similarity >= TRIGRAM_THRESHOLD and token not in candidates:
+                candidates[token] = 0.7 * similarity
+        return candidates
+
+    def search(self, words):
+        """key -> score for documents matching every word."""
+        scores = None
+        for word in words:
+            best = {}
+            for token, score in self._candidates(word).items():
+                for key in self.token_docs[token]:
+                    if score > best.get(key, 0):
+                        best[key] = score
+            if scores is None:
+                scores = best
+            else:
+                scores = {key: scores[key] + score for key, score in best.items() if key in scores}
+            if not scores:
+                break
+        return scores or {}
+
+
+class SearchIndex:
+    """In-memory prefix and trigram index over the catalog translation labels.
+
+    Rows changed through sync_translations are re-indexed on commit. Content
+    versions catch writes this process did not see (other workers sharing a
+    FileContentCache); a changed table is then reloaded in one query.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.documents = {}
+        self.label_lengths = {}
+        self.by_parent = {}
+        self.languages = {}
+        self.versions = {}
+        self._applied = set()
+        self.built = False
+
+    def _document(self, model, row):
+        kind, _, links = SEARCH_SOURCES[model]
+        translation_id, parent_id, language_id, label = row[:4]
+        document = {'type': kind, 'id': parent_id, 'language': language_id, 'label': label}
+        document.update(zip(links, row[4:]))
+        return (content_type(model), translation_id), document
+
+    def _rows(self, model, **filters):
+        _, parent_field, links = SEARCH_SOURCES[model]
+        return model.objects.filter(**filters).values_list(
+            'id', parent_field, 'language', 'label', *links.values()
+        )
+
+    def _add(self, key, document):
+        self.documents[key] = document
+        self.label_lengths[key] = len(document['label'] or '')
+        self.by_parent.setdefault((key[0], document['id']), set()).add(key)
+        self.languages.setdefault(document['language'], _LanguageIndex()).add(key, normalize(document['label']))
+
+    def _remove(self, key):
+        document = self.documents.pop(key)
+        del self.label_lengths[key]
+        siblings = self.by_parent[key[0], document['id']]
+        siblings.discard(key)
+        if not siblings:
+            del self.by_parent[key[0], document['id']]
+        self.languages[document['language']].remove(key, normalize(document['label']))
+
+    def _load(self, model):
+        name = content_type(model)
+        for key in [key for key in self.documents if key[0] == name]:
+            self._remove(key)
+        for row in self._rows(model):
+            self._add(*self._document(model, row))
+
+    def refresh(self):
+        """Build on first use; reload tables whose version moved without a local update."""
+        current = dict(model_versions(SEARCH_SOURCES))
+        with self._lock:
+            for model in SEARCH_SOURCES:
+                name = content_type(model)
+                if self.built and current[name] == self.versions.get(name):
+                    continue
+                # A local sync already re-indexed this table; the version moved
+                # because of that same write.
+                if self.built and name in self._applied:
+                    self._applied.discard(name)
+                else:
+                    self._load(model)
+                self.versions[name] = current[name]
+            self.built = True
+
+    def apply(self, model, parent_ids):
+        """Re-index the translations of ``parent_ids`` after a write."""
+        if model not in SEARCH_SOURCES:
+            return
+        _, parent_field, _ = SEARCH_SOURCES[model]
+        with self._lock:
+            if not self.built:
+                return
+            name = content_type(model)
+            for parent_id in parent_ids:
+                for key in list(self.by_parent.get((name, parent_id), ())):
+                    self._remove(key)
+            for row in self._rows(model, **{'%s__in' % parent_field: parent_ids}):
+                self._add(*self._document(model, row))
+            self._applied.add(name)
+
+    def search(self, query, language=None, limit=DEFAULT_LIMIT):
+        """Documents matching every word of ``query``, best first."""
+        words = normalize(query)
+        if not words:
+            return []
+        self.refresh()
+        with self._lock:
+            if language is not None:
+                indexes = [self.languages.get(language.id)]
+            else:
+                indexes = list(self.languages.values())
+            scores = {}
+            for index in indexes:
+                if index is not None:
+                    scores.update(index.search(words))
+            # Best score first, then the shortest (closest) label.
+            ranked = heapq.nsmallest(limit, scores, key=lambda key: (-scores[key], self.label_lengths[key], key))
+            return [
+                dict(self.documents[key], score=round(scores[key] / len(words), 3))
+                for key in ranked
+            ]
+
+
+_search_index = SearchIndex()
+
+
+def get_search_index():
+    return _search_index
+
+
+def _on_translations_changed(sender, parent_ids, **kwargs):
+    _search_index.apply(sender, parent_ids)
+
+
+translations_changed.connect(_on_translations_changed, dispatch_uid='app.search')
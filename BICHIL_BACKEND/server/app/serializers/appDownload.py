@@ -2,13 +2,12 @@ from rest_framework import serializers
 from app.models.models import (
     AppDownload, AppDownloadList, AppDownloadListTranslation,
     AppDownloadTitle, AppDownloadTitleTranslation, AppDownloadTitlePosition,
-    Language
 )
+from app.serializers.fields import LanguageField, SrcsetField
+from app.serializers.mixins import ContentVersionMixin, MediaDerivativesMixin
 
 class AppDownloadListTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.PrimaryKeyRelatedField(
-        source='language', queryset=Language.objects.all()
-    )
+    language_id = LanguageField(source='language')
 
     class Meta:
         model = AppDownloadListTranslation
@@ -26,9 +25,7 @@ class AppDownloadListSerializer(serializers.ModelSerializer):
 
 
 class AppDownloadTitleTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.PrimaryKeyRelatedField(
-        source='language', queryset=Language.objects.all()
-    )
+    language_id = LanguageField(source='language')
 
     class Meta:
         model = AppDownloadTitleTranslation
@@ -60,18 +57,21 @@ class AppDownloadReadSerializer(serializers.ModelSerializer):
     titles = AppDownloadTitleSerializer(
         source='appdownloadtitle_set', many=True, read_only=True
     )
+    srcset = SrcsetField(source='image')
 
     class Meta:
         model = AppDownload
         fields = [
-            "id", "image", "appstore", "playstore", "title_position", "divide",
+            "id", "image", "srcset", "appstore", "playstore", "title_position", "divide",
             "font", "titlecolor", "fontcolor", "listcolor", "iconcolor",
             "buttonbgcolor", "buttonfontcolor",
             "lists", "titles"
         ]
 
 
-class AppDownloadWriteSerializer(serializers.ModelSerializer):
+class AppDownloadWriteSerializer(ContentVersionMixin, MediaDerivativesMixin, serializers.ModelSerializer):
+    media_fields = ('image',)
+
     class Meta:
         model = AppDownload
         fields = [
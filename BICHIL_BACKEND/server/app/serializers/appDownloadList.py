@@ -1,10 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
-from app.models.models import AppDownloadList, AppDownloadListTranslation, Language, AppDownload
+from app.models.models import AppDownloadList, AppDownloadListTranslation, AppDownload
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
 
-class AppDownloadListTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.PrimaryKeyRelatedField(
-        source='language', queryset=Language.objects.all()
-    )
+class AppDownloadListTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language_id = LanguageField(source='language')
 
     class Meta:
         model = AppDownloadListTranslation
@@ -30,13 +33,17 @@ class AppDownloadListSerializer(serializers.ModelSerializer):
         model = AppDownloadList
         fields = ['id', 'app_download_id', 'translations', 'translations_read']
 
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('translations', [])
         app_list = AppDownloadList.objects.create(**validated_data)
-        for t_data in translations_data:
-            AppDownloadListTranslation.objects.create(app_download_list=app_list, **t_data)
+        sync_translations(
+            AppDownloadListTranslation, 'app_download_list', app_list, translations_data, new_parent=True
+        )
+        bump_content_version(AppDownloadList, AppDownloadListTranslation)
         return app_list
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('translations', [])
         for attr, value in validated_data.items():
@@ -44,8 +51,7 @@ class AppDownloadListSerializer(serializers.ModelSerializer):
         instance.save()
 
         if translations_data:
-            instance.appdownloadlisttranslation_set.all().delete()
-            for t_data in translations_data:
-                AppDownloadListTranslation.objects.create(app_download_list=instance, **t_data)
+            sync_translations(AppDownloadListTranslation, 'app_download_list', instance, translations_data)
 
+        bump_content_version(AppDownloadList, AppDownloadListTranslation)
         return instance
@@ -1,12 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
 from app.models.models import AppDownloadTitle, AppDownloadTitleTranslation, AppDownloadTitlePosition, AppDownload
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
 
-from app.models.models import Language
-
-class AppDownloadTitleTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.PrimaryKeyRelatedField(
-        source='language', queryset=Language.objects.all()
-    )
+class AppDownloadTitleTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language_id = LanguageField(source='language')
 
     class Meta:
         model = AppDownloadTitleTranslation
@@ -45,20 +46,24 @@ class AppDownloadTitleSerializer(serializers.ModelSerializer):
             'position', 'position_read'
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('translations', [])
         position_data = validated_data.pop('position', None)
 
         title = AppDownloadTitle.objects.create(**validated_data)
 
-        for t_data in translations_data:
-            AppDownloadTitleTranslation.objects.create(app_download_title=title, **t_data)
+        sync_translations(
+            AppDownloadTitleTranslation, 'app_download_title', title, translations_data, new_parent=True
+        )
 
         if position_data:
             AppDownloadTitlePosition.objects.create(app_download_title=title, **position_data)
 
+        bump_content_version(AppDownloadTitle, AppDownloadTitleTranslation, AppDownloadTitlePosition)
         return title
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('translations', [])
         position_data = validated_data.pop('position', None)
@@ -68,12 +73,11 @@ class AppDownloadTitleSerializer(serializers.ModelSerializer):
         instance.save()
 
         if translations_data:
-            instance.appdownloadtitletranslation_set.all().delete()
-            for t_data in translations_data:
-                AppDownloadTitleTranslation.objects.create(app_download_title=instance, **t_data)
+            sync_translations(AppDownloadTitleTranslation, 'app_download_title', instance, translations_data)
 
         if position_data:
             instance.appdownloadtitleposition_set.all().delete()
             AppDownloadTitlePosition.objects.create(app_download_title=instance, **position_data)
 
+        bump_content_version(AppDownloadTitle, AppDownloadTitleTranslation, AppDownloadTitlePosition)
         return instance
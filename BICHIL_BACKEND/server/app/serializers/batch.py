@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+# Writes only: content versions move when the batch commits, so a read
+# inside it could be answered from the cache as of before the batch.
+BATCH_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+MAX_OPERATIONS = 50
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=BATCH_METHODS)
+    path = serializers.RegexField(r'^/api/v1/', max_length=500)
+    body = serializers.JSONField(required=False)
+
+
+class BatchSerializer(serializers.Serializer):
+    operations = BatchOperationSerializer(many=True, allow_empty=False, max_length=MAX_OPERATIONS)
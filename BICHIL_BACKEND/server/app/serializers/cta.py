@@ -1,13 +1,23 @@
+from django.db import transaction
 from rest_framework import serializers
+from app.media import queue_derivatives
 from app.models.models import Cta, CtaTitle, CtaSubtitle
+from app.serializers.fields import LanguageField, SrcsetField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
+
+class CtaTitleSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
 
-class CtaTitleSerializer(serializers.ModelSerializer):
     class Meta:
         model = CtaTitle
         fields = ["id", "language", "label"]
 
 
-class CtaSubtitleSerializer(serializers.ModelSerializer):
+class CtaSubtitleSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
+
     class Meta:
         model = CtaSubtitle
         fields = ["id", "language", "label"]
@@ -20,12 +30,14 @@ class CtaSerializer(serializers.ModelSerializer):
     subtitles = CtaSubtitleSerializer(
         source="ctasubtitle_set", many=True
     )
+    srcset = SrcsetField(source="file")
 
     class Meta:
         model = Cta
         fields = [
             "id",
             "file",
+            "srcset",
             "index",
             "font",
             "color",
@@ -34,28 +46,21 @@ class CtaSerializer(serializers.ModelSerializer):
             "subtitles",
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         titles_data = validated_data.pop("ctatitle_set", [])
         subtitles_data = validated_data.pop("ctasubtitle_set", [])
 
         cta = Cta.objects.create(**validated_data)
 
-        for title in titles_data:
-            CtaTitle.objects.create(
-                cta=cta,
-                language=title["language"],
-                label=title["label"],
-            )
-
-        for subtitle in subtitles_data:
-            CtaSubtitle.objects.create(
-                cta=cta,
-                language=subtitle["language"],
-                label=subtitle["label"],
-            )
+        sync_translations(CtaTitle, "cta", cta, titles_data, new_parent=True)
+        sync_translations(CtaSubtitle, "cta", cta, subtitles_data, new_parent=True)
 
+        bump_content_version(Cta, CtaTitle, CtaSubtitle)
+        queue_derivatives(cta.file)
         return cta
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         titles_data = validated_data.pop("ctatitle_set", [])
         subtitles_data = validated_data.pop("ctasubtitle_set", [])
@@ -64,21 +69,9 @@ class CtaSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        CtaTitle.objects.filter(cta=instance).delete()
-        CtaSubtitle.objects.filter(cta=instance).delete()
-
-        for title in titles_data:
-            CtaTitle.objects.create(
-                cta=instance,
-                language=title["language"],
-                label=title["label"],
-            )
-
-        for subtitle in subtitles_data:
-            CtaSubtitle.objects.create(
-                cta=instance,
-                language=subtitle["language"],
-                label=subtitle["label"],
-            )
+        sync_translations(CtaTitle, "cta", instance, titles_data)
+        sync_translations(CtaSubtitle, "cta", instance, subtitles_data)
 
+        bump_content_version(Cta, CtaTitle, CtaSubtitle)
+        queue_derivatives(instance.file)
         return instance
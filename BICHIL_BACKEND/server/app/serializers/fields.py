@@ -0,0 +1,49 @@
+from rest_framework import serializers
+
+from app.media import srcset
+from app.models.models import Language
+from app.utils.language import get_language_registry
+
+
+class SrcsetField(serializers.Field):
+    """Responsive variants of an image reference, null until they are generated."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return srcset(value)
+
+
+class LanguageField(serializers.PrimaryKeyRelatedField):
+    """Language by id (or lang_code), resolved from the in-process registry.
+
+    Validation needs no query per item; output is the id, read straight from
+    the ``language_id`` column.
+    """
+
+    default_error_messages = dict(
+        serializers.PrimaryKeyRelatedField.default_error_messages,
+        does_not_exist='Invalid language "{pk_value}" - object does not exist.',
+    )
+
+    def __init__(self, **kwargs):
+        if not kwargs.get('read_only'):
+            kwargs.setdefault('queryset', Language.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        registry = get_language_registry()
+        # Only whole ids: int() would also turn 1.9 or True into language 1.
+        if isinstance(data, int) and not isinstance(data, bool):
+            language = registry.get(data)
+        elif isinstance(data, str) and data.isascii() and data.isdigit():
+            language = registry.get(int(data))
+        elif isinstance(data, str):
+            language = registry.by_code(data)
+        else:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if language is None:
+            self.fail('does_not_exist', pk_value=data)
+        return language
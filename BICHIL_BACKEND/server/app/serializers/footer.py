@@ -1,10 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
-from app.models.models import Footer, FooterTranslations, Language
+from app.models.models import Footer, FooterTranslations
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
 
-class FooterTranslationsSerializer(serializers.ModelSerializer):
-    language_id = serializers.PrimaryKeyRelatedField(
-        source='language', queryset=Language.objects.all()
-    )
+class FooterTranslationsSerializer(TranslationMixin, serializers.ModelSerializer):
+    language_id = LanguageField(source='language')
 
     class Meta:
         model = FooterTranslations
@@ -24,15 +27,17 @@ class FooterSerializer(serializers.ModelSerializer):
             'titlesize', 'fontsize', 'translations', 'translations_read'
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('translations', [])
         footer = Footer.objects.create(**validated_data)
 
-        for t_data in translations_data:
-            FooterTranslations.objects.create(footer=footer, **t_data)
+        sync_translations(FooterTranslations, 'footer', footer, translations_data, new_parent=True)
 
+        bump_content_version(Footer, FooterTranslations)
         return footer
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('translations', [])
 
@@ -41,8 +46,7 @@ class FooterSerializer(serializers.ModelSerializer):
         instance.save()
 
         if translations_data:
-            instance.footertranslations_set.all().delete()
-            for t_data in translations_data:
-                FooterTranslations.objects.create(footer=instance, **t_data)
+            sync_translations(FooterTranslations, 'footer', instance, translations_data)
 
+        bump_content_version(Footer, FooterTranslations)
         return instance
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from app.models.models import HeaderStyle
+from app.serializers.mixins import ContentVersionMixin
 
-class HeaderStyleSerializer(serializers.ModelSerializer):
+class HeaderStyleSerializer(ContentVersionMixin, serializers.ModelSerializer):
     class Meta:
         model = HeaderStyle
         fields = ('id', 'header', 'bgcolor', 'fontcolor', 'hovercolor', 'height', 'sticky')
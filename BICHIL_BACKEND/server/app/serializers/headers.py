@@ -4,23 +4,25 @@ from app.models.models import (
     HeaderSubmenu, HeaderSubmenuTranslation,
     HeaderTertiaryMenu, HeaderTertiaryMenuTranslation,
 )
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import ContentVersionMixin
 
 class HeaderMenuTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.IntegerField(source='language.id')
+    language_id = LanguageField(source='language', read_only=True)
 
     class Meta:
         model = HeaderMenuTranslation
         fields = ['id', 'label', 'language_id']
 
 class HeaderSubmenuTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.IntegerField(source='language.id')
+    language_id = LanguageField(source='language', read_only=True)
 
     class Meta:
         model = HeaderSubmenuTranslation
         fields = ['id', 'label', 'language_id']
 
 class HeaderTertiaryMenuTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.IntegerField(source='language.id')
+    language_id = LanguageField(source='language', read_only=True)
 
     class Meta:
         model = HeaderTertiaryMenuTranslation
@@ -62,7 +64,7 @@ class HeaderSerializer(serializers.ModelSerializer):
         model = Header
         fields = ['id', 'logo', 'active', 'styles', 'menus']
 
-class HeaderCreateUpdateSerializer(serializers.ModelSerializer):
+class HeaderCreateUpdateSerializer(ContentVersionMixin, serializers.ModelSerializer):
     class Meta:
         model = Header
         fields = ['logo', 'active']
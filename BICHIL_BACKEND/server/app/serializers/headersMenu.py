@@ -1,17 +1,28 @@
+from django.db import transaction
 from rest_framework import serializers
 from app.models.models import *
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
+
+class HeaderMenuTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
 
-class HeaderMenuTranslationSerializer(serializers.ModelSerializer):
     class Meta:
         model = HeaderMenuTranslation
         fields = ['language', 'label'] 
 
-class HeaderSubmenuTranslationSerializer(serializers.ModelSerializer):
+class HeaderSubmenuTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
+
     class Meta:
         model = HeaderSubmenuTranslation
         fields = ['id', 'language', 'label']
 
-class HeaderTertiaryMenuTranslationSerializer(serializers.ModelSerializer):
+class HeaderTertiaryMenuTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
+
     class Meta:
         model = HeaderTertiaryMenuTranslation
         fields = ['id', 'language', 'label']
@@ -40,14 +51,16 @@ class HeaderMenuSerializer(serializers.ModelSerializer):
         model = HeaderMenu
         fields = ['id', 'header', 'font', 'path', 'index', 'visible', 'translations']
 
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('headermenutranslation_set', [])
         menu = HeaderMenu.objects.create(**validated_data)
 
-        for trans in translations_data:
-            HeaderMenuTranslation.objects.create(menu=menu, **trans)
+        sync_translations(HeaderMenuTranslation, 'menu', menu, translations_data, new_parent=True)
+        bump_content_version(HeaderMenu, HeaderMenuTranslation)
         return menu
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('headermenutranslation_set', [])
 
@@ -55,11 +68,7 @@ class HeaderMenuSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        for trans in translations_data:
-            HeaderMenuTranslation.objects.update_or_create(
-                menu=instance,
-                language=trans['language'],
-                defaults={'label': trans['label']}
-            )
+        sync_translations(HeaderMenuTranslation, 'menu', instance, translations_data, delete_missing=False)
 
+        bump_content_version(HeaderMenu, HeaderMenuTranslation)
         return instance
\ No newline at end of file
@@ -1,12 +1,21 @@
+from django.db import transaction
 from rest_framework import serializers
 from app.models.models import HeaderSubmenu, HeaderSubmenuTranslation, HeaderTertiaryMenu, HeaderTertiaryMenuTranslation
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
+
+class HeaderSubmenuTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
 
-class HeaderSubmenuTranslationSerializer(serializers.ModelSerializer):
     class Meta:
         model = HeaderSubmenuTranslation
         fields = ['language', 'label']
 
-class HeaderTertiaryMenuTranslationSerializer(serializers.ModelSerializer):
+class HeaderTertiaryMenuTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language = LanguageField(allow_null=True)
+
     class Meta:
         model = HeaderTertiaryMenuTranslation
         fields = ['language', 'label']
@@ -29,15 +38,17 @@ class HeaderSubmenuSerializer(serializers.ModelSerializer):
         model = HeaderSubmenu
         fields = ['id', 'header_menu', 'font', 'path', 'index', 'visible', 'translations']
 
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('headersubmenutranslation_set', [])
         submenu = HeaderSubmenu.objects.create(**validated_data)
 
-        for trans in translations_data:
-            HeaderSubmenuTranslation.objects.create(submenu=submenu, **trans)
+        sync_translations(HeaderSubmenuTranslation, 'submenu', submenu, translations_data, new_parent=True)
 
+        bump_content_version(HeaderSubmenu, HeaderSubmenuTranslation)
         return submenu
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('headersubmenutranslation_set', [])
 
@@ -45,11 +56,7 @@ class HeaderSubmenuSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        for trans in translations_data:
-            HeaderSubmenuTranslation.objects.update_or_create(
-                submenu=instance,
-                language=trans['language'],
-                defaults={'label': trans['label']}
-            )
+        sync_translations(HeaderSubmenuTranslation, 'submenu', instance, translations_data, delete_missing=False)
 
+        bump_content_version(HeaderSubmenu, HeaderSubmenuTranslation)
         return instance
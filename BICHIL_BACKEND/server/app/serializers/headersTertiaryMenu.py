@@ -1,8 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
-from app.models.models import HeaderTertiaryMenu, HeaderTertiaryMenuTranslation, Language
+from app.models.models import HeaderTertiaryMenu, HeaderTertiaryMenuTranslation
+from app.serializers.fields import LanguageField
+from app.serializers.mixins import TranslationMixin
+from app.utils.cache import bump_content_version
+from app.utils.translations import sync_translations
 
-class HeaderTertiaryMenuTranslationSerializer(serializers.ModelSerializer):
-    language_id = serializers.IntegerField(source='language.id')
+class HeaderTertiaryMenuTranslationSerializer(TranslationMixin, serializers.ModelSerializer):
+    language_id = LanguageField(source='language')
 
     class Meta:
         model = HeaderTertiaryMenuTranslation
@@ -20,20 +25,25 @@ class HeaderTertiaryMenuSerializer(serializers.ModelSerializer):
         model = HeaderTertiaryMenu
         fields = ('id', 'header_submenu', 'font', 'path', 'index', 'visible', 'translations')
 
+    def _translation_rows(self, translations_data):
+        return [
+            {'language': trans_data['language'], 'label': trans_data.get('label', '')}
+            for trans_data in translations_data
+        ]
+
+    @transaction.atomic
     def create(self, validated_data):
         translations_data = validated_data.pop('headertertiarymenutranslation_set', [])
         menu = HeaderTertiaryMenu.objects.create(**validated_data)
 
-        for trans_data in translations_data:
-            lang_id = trans_data['language']['id']
-            language = Language.objects.get(id=lang_id)
-            HeaderTertiaryMenuTranslation.objects.create(
-                tertiary_menu=menu,
-                language=language,
-                label=trans_data['label']
-            )
+        sync_translations(
+            HeaderTertiaryMenuTranslation, 'tertiary_menu', menu,
+            self._translation_rows(translations_data), new_parent=True
+        )
+        bump_content_version(HeaderTertiaryMenu, HeaderTertiaryMenuTranslation)
         return menu
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         translations_data = validated_data.pop('headertertiarymenutranslation_set', [])
 
@@ -41,15 +51,10 @@ class HeaderTertiaryMenuSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        for trans_data in translations_data:
-            lang_id = trans_data['language']['id']
-            language = Language.objects.get(id=lang_id)
-            label = trans_data.get('label', '')
-
-            translation_obj, created = HeaderTertiaryMenuTranslation.objects.update_or_create(
-                tertiary_menu=instance,
-                language=language,
-                defaults={'label': label}
-            )
+        sync_translations(
+            HeaderTertiaryMenuTranslation, 'tertiary_menu', instance,
+            self._translation_rows(translations_data), delete_missing=False
+        )
 
+        bump_content_version(HeaderTertiaryMenu, HeaderTertiaryMenuTranslation)
         return instance
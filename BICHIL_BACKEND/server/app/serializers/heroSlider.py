@@ -1,8 +1,13 @@
 from rest_framework import serializers
 from app.models.models import HeroSlider
+from app.serializers.fields import SrcsetField
+from app.serializers.mixins import ContentVersionMixin, MediaDerivativesMixin
 
 
-class HeroSliderSerializer(serializers.ModelSerializer):
+class HeroSliderSerializer(ContentVersionMixin, MediaDerivativesMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source='file')
+    media_fields = ('file',)
+
     class Meta:
         model = HeroSlider
         fields = "__all__"
@@ -0,0 +1,48 @@
+from rest_framework import serializers
+
+from app.media import queue_derivatives
+from app.utils.cache import bump_content_version
+
+
+class ContentVersionMixin:
+    """Bump the cached-read version of ``Meta.model`` on every create/update."""
+
+    def create(self, validated_data):
+        instance = super().create(validated_data)
+        bump_content_version(self.Meta.model)
+        return instance
+
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        bump_content_version(self.Meta.model)
+        return instance
+
+
+class MediaDerivativesMixin:
+    """Queue image derivatives of the ``media_fields`` references on every create/update."""
+
+    media_fields = ()
+
+    def create(self, validated_data):
+        instance = super().create(validated_data)
+        queue_derivatives(*(getattr(instance, field) for field in self.media_fields))
+        return instance
+
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        queue_derivatives(*(getattr(instance, field) for field in self.media_fields))
+        return instance
+
+
+class TranslationMixin:
+    """Require a language on every translation row; sync_translations matches rows by it.
+
+    Checked in validate() as well as on the field, since partial updates skip
+    missing fields.
+    """
+
+    def validate(self, attrs):
+        if 'language' not in attrs:
+            name = next(name for name, field in self.fields.items() if field.source == 'language')
+            raise serializers.ValidationError({name: [self.fields[name].error_messages['required']]})
+        return super().validate(attrs)
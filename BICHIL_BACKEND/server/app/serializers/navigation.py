@@ -0,0 +1,47 @@
+from rest_framework import serializers
+from app.models.models import HeaderMenu, HeaderSubmenu, HeaderTertiaryMenu
+from app.navigation import default_font
+from app.serializers.fields import LanguageField
+
+
+class NavigationNodeSerializer(serializers.ModelSerializer):
+    """One node of a PUT /headers/{id}/navigation/ tree; ``id`` is omitted for new nodes."""
+
+    id = serializers.IntegerField(required=False)
+    labels = serializers.DictField(
+        child=serializers.CharField(allow_blank=True, allow_null=True), required=False
+    )
+
+    class Meta:
+        fields = ['id', 'path', 'font', 'index', 'visible', 'labels']
+
+    def validate(self, attrs):
+        if attrs.get('id') is None and attrs.get('font') is None and default_font(self.Meta.model) is None:
+            raise serializers.ValidationError({'font': 'This field is required for new nodes.'})
+        return attrs
+
+    def validate_labels(self, labels):
+        # Keys are language ids (as GET returns them) or lang_codes.
+        language_field = LanguageField()
+        return {language_field.to_internal_value(key).pk: label for key, label in labels.items()}
+
+
+class NavigationTertiarySerializer(NavigationNodeSerializer):
+    class Meta(NavigationNodeSerializer.Meta):
+        model = HeaderTertiaryMenu
+
+
+class NavigationSubmenuSerializer(NavigationNodeSerializer):
+    children = NavigationTertiarySerializer(many=True, required=False)
+
+    class Meta(NavigationNodeSerializer.Meta):
+        model = HeaderSubmenu
+        fields = NavigationNodeSerializer.Meta.fields + ['children']
+
+
+class NavigationMenuSerializer(NavigationNodeSerializer):
+    children = NavigationSubmenuSerializer(many=True, required=False)
+
+    class Meta(NavigationNodeSerializer.Meta):
+        model = HeaderMenu
+        fields = NavigationNodeSerializer.Meta.fields + ['children']
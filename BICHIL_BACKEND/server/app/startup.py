@@ -0,0 +1,82 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import namedtuple
+
+from django.conf import settings
+
+# self_us and cumulative_us as reported by ``python -X importtime``; depth 0
+# is a module imported directly by the entry point.
+ImportTiming = namedtuple('ImportTiming', ['module', 'self_us', 'cumulative_us', 'depth'])
+
+ENTRY_POINTS = ('server.wsgi', 'server.asgi')
+# Resolving a URL loads the URLconf and the view behind it, which is what a
+# worker's first request pays on top of booting.
+FIRST_REQUEST_PATH = '/api/v1/footer/'
+
+_SCRIPT = '''
+import json, sys, time
+from importlib import import_module
+
+start = time.perf_counter()
+import_module(sys.argv[1])
+timings = {'boot_ms': (time.perf_counter() - start) * 1000}
+if len(sys.argv) > 2:
+    from django.urls import resolve
+    start = time.perf_counter()
+    resolve(sys.argv[2])
+    timings['first_request_ms'] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+'''
+
+
+def _run(entry_point, path=None, importtime=False):
+    """Import ``entry_point`` (and resolve ``path``) in a fresh interpreter."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(settings.BASE_DIR), env.get('PYTHONPATH')]))
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', _SCRIPT, entry_point]
+    if path:
+        command.append(path)
+    result = subprocess.run(command, cwd=str(settings.BASE_DIR), env=env, capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError('Importing %s failed:\n%s' % (entry_point, result.stderr[-2000:]))
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def parse_importtime(output):
+    """ImportTiming per line of ``-X importtime`` output, in import order."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue  # header line
+        name = module.rstrip()
+        timings.append(ImportTiming(
+            name.strip(), int(self_us), int(cumulative_us), (len(name) - len(name.lstrip()) - 1) // 2,
+        ))
+    return timings
+
+
+def profile_imports(entry_point, path=None):
+    """``(timings, imports)`` of one cold start of ``entry_point`` under ``-X importtime``.
+
+    Import timing adds overhead of its own; use measure_startup for the
+    numbers to track.
+    """
+    timings, stderr = _run(entry_point, path, importtime=True)
+    return timings, parse_importtime(stderr)
+
+
+def measure_startup(entry_points=ENTRY_POINTS, path=FIRST_REQUEST_PATH, runs=5):
+    """Median boot and first-request time of each entry point over ``runs`` fresh interpreters."""
+    report = {}
+    for entry_point in entry_points:
+        samples = [_run(entry_point, path)[0] for _ in range(runs)]
+        report[entry_point] = {
+            key: round(statistics.median(sample[key] for sample in samples), 3) for key in samples[0]
+        }
+    return report
@@ -0,0 +1,177 @@
+from contextlib import ExitStack
+
+from django.db import connection, connections
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from app.utils.cache import get_content_cache
+
+API_PREFIX = '/api/v1/'
+
+
+def registered_viewsets():
+    """(prefix, viewset, basename) for every router registration served under /api/v1/."""
+    from app.urls import router
+    from app.categories.urls import router as categories_router
+    return router.viewsets() + categories_router.viewsets()
+
+
+def count_queries(client, url, **extra):
+    get_content_cache().reset()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, **extra)
+    return response, len(queries)
+
+
+def check_query_budgets(client, lang=None):
+    """Request every budgeted list/retrieve endpoint; return the ones over budget.
+
+    Each violation is ``(url, queries, budget)``. The content cache is cleared
+    before each request so the ORM path is what gets measured. Resolving
+    ``lang`` is allowed one extra query.
+    """
+    violations = []
+    query = '?lang=%s' % lang if lang else ''
+    extra = 1 if lang else 0
+    for prefix, viewset, basename in registered_viewsets():
+        budget = getattr(viewset, 'query_budget', {})
+        list_url = '%s%s/' % (API_PREFIX, prefix)
+        if 'list' in budget:
+            response, queries = count_queries(client, list_url + query)
+            if queries > budget['list'] + extra:
+                violations.append((list_url + query, queries, budget['list']))
+        if 'retrieve' in budget:
+            instance = viewset.queryset.model.objects.order_by('pk').first()
+            if instance is None:
+                continue
+            url = '%s%s/' % (list_url, instance.pk)
+            response, queries = count_queries(client, url + query)
+            if queries > budget['retrieve'] + extra:
+                violations.append((url + query, queries, budget['retrieve']))
+    return violations
+
+
+class QueryBudgetTestMixin:
+    """TestCase mixin failing when a router endpoint exceeds its ``query_budget``."""
+
+    def assertQueryBudgets(self, lang=None):
+        violations = check_query_budgets(self.client, lang)
+        if violations:
+            self.fail('Query budget exceeded:\n' + '\n'.join(
+                '  %s: %d queries (budget %d)' % violation for violation in violations
+            ))
+
+
+class ContentTestCase(TestCase):
+    """TestCase over the unmanaged content tables, filled by generate_content(``volumes``).
+
+    The test runner only creates managed tables, so the content tables are
+    created here, once per test database. The content cache is reset before
+    every test, since its entries outlive each test's rollback.
+    """
+
+    volumes = None
+
+    @classmethod
+    def setUpClass(cls):
+        from app.benchmarks.data import create_tables
+        create_tables()
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        from app.benchmarks.data import generate_content
+        generate_content(cls.volumes)
+
+    def setUp(self):
+        super().setUp()
+        get_content_cache().reset()
+
+
+def read_serializers():
+    """Read serializer of every registered viewset plus the bootstrap sections."""
+    from app.views.bootstrap import SECTION_SERIALIZERS
+    classes = list(SECTION_SERIALIZERS)
+    for _, viewset, _ in registered_viewsets():
+        classes.append(viewset(action='list').get_serializer_class())
+    return list(dict.fromkeys(classes))
+
+
+def check_read_parity():
+    """Compare the values() read path with the serializers, byte for byte.
+
+    Returns ``(checked, skipped, mismatches)``: serializer names, serializers
+    without a values() equivalent, and ``(serializer, lang_code)`` pairs whose
+    rendered output differs.
+    """
+    from rest_framework.renderers import JSONRenderer
+    from app.models.models import Language
+    from app.renderers import FastJSONRenderer
+    from app.utils.prefetch import apply_prefetch_plan
+    from app.utils.values import build_values, supports_values_read, values_queryset
+
+    languages = [None] + list(Language.objects.order_by('id'))
+    checked, skipped, mismatches = [], [], []
+    for serializer_class in read_serializers():
+        if not supports_values_read(serializer_class):
+            skipped.append(serializer_class.__name__)
+            continue
+        checked.append(serializer_class.__name__)
+        queryset = serializer_class.Meta.model._default_manager.order_by('pk')
+        for language in languages:
+            expected = JSONRenderer().render(
+                serializer_class(apply_prefetch_plan(queryset, serializer_class, language), many=True).data
+            )
+            actual = FastJSONRenderer().render(
+                build_values(values_queryset(queryset, serializer_class), serializer_class, language)
+            )
+            if actual != expected:
+                mismatches.append((serializer_class.__name__, language.lang_code if language else 'all'))
+    return checked, skipped, mismatches
+
+
+def served_by(client, url, **extra):
+    """Database aliases that ran queries for ``client.get(url)``, content cache reset."""
+    get_content_cache().reset()
+    served = set()
+
+    def recorder(alias):
+        def record(execute, sql, params, many, context):
+            served.add(alias)
+            return execute(sql, params, many, context)
+        return record
+
+    # execute_wrapper, unlike CaptureQueriesContext, does not connect, so a
+    # replica that is down stays untouched.
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder(alias)))
+        client.get(url, **extra)
+    return sorted(served)
+
+
+def check_replica_routing(client, url=API_PREFIX + 'hero-slider/'):
+    """Read ``url`` as a plain client, a pinned client and with every replica down.
+
+    Returns ``(case, expected aliases, aliases that served it)`` triples. The
+    plain read only reaches a replica if nothing was written to its models
+    within READ_STICKY_SECONDS.
+    """
+    from app.middleware import PRIMARY_PIN_COOKIE
+    from app.routers import mark_replica_down, mark_replica_up, read_replicas
+
+    replicas = sorted(read_replicas())
+    results = [('read', replicas, served_by(client, url))]
+
+    client.cookies[PRIMARY_PIN_COOKIE] = '1'
+    results.append(('read after write', ['default'], served_by(client, url)))
+    del client.cookies[PRIMARY_PIN_COOKIE]
+
+    for alias in replicas:
+        mark_replica_down(alias)
+    try:
+        results.append(('replicas down', ['default'], served_by(client, url)))
+    finally:
+        for alias in replicas:
+            mark_replica_up(alias)
+    return results
@@ -0,0 +1,66 @@
+from unittest import mock, skipUnless
+
+from django.test import SimpleTestCase
+
+from app.categories import calculator
+from app.models.models import ProductDetails
+from app.testing import API_PREFIX, ContentTestCase
+
+CALCULATOR_URL = API_PREFIX + 'categories/calculator/'
+
+
+def python_only():
+    return mock.patch.object(calculator, 'numpy', None)
+
+
+class AmortizeTests(SimpleTestCase):
+    cases = ([1.5, 0, 3.2], [12, 6, 24])
+
+    def test_no_cases(self):
+        for schedule in (False, True):
+            self.assertEqual(calculator.amortize(1000, [], [], schedule), [])
+            with python_only():
+                self.assertEqual(calculator.amortize(1000, [], [], schedule), [])
+
+    def test_python_path(self):
+        with python_only():
+            results = calculator.amortize(1200, *self.cases, schedule=True)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[1]['monthly_payment'], 200.0)
+        self.assertEqual(results[1]['total_interest'], 0.0)
+        for result, term in zip(results, self.cases[1]):
+            self.assertEqual(len(result['schedule']['balance']), term)
+            self.assertEqual(result['schedule']['balance'][-1], 0.0)
+
+    @skipUnless(calculator.numpy, 'NumPy is not installed')
+    def test_numpy_matches_python(self):
+        for schedule in (False, True):
+            with python_only():
+                expected = calculator.amortize(1200, *self.cases, schedule=schedule)
+            self.assertEqual(calculator.amortize(1200, *self.cases, schedule=schedule), expected)
+
+
+class CalculatorViewTests(ContentTestCase):
+    volumes = {'products': 2}
+
+    def test_unknown_details(self):
+        for amortized in (mock.patch.object(calculator, 'numpy', calculator.numpy), python_only()):
+            with amortized:
+                response = self.client.get(CALCULATOR_URL, {
+                    'amount': 1000, 'terms': 12, 'details': 99999, 'schedule': 'true',
+                })
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['results'], [])
+            self.assertEqual(response.json()['missing'], [99999])
+
+    def test_schedule(self):
+        detail = ProductDetails.objects.order_by('id').first()
+        response = self.client.get(CALCULATOR_URL, {
+            'amount': 1000, 'terms': '6,12', 'details': detail.pk, 'schedule': 'true',
+        })
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([result['term_months'] for result in results], [6, 12])
+        for result in results:
+            self.assertEqual(set(result['rates']), {'min', 'max'})
+            self.assertEqual(len(result['rates']['min']['schedule']['balance']), result['term_months'])
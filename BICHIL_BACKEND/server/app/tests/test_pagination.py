@@ -0,0 +1,37 @@
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import resolve
+
+from app.testing import API_PREFIX, ContentTestCase
+
+SUBMENUS_URL = API_PREFIX + 'header-submenu/'
+
+
+@override_settings(MAX_PAGE_SIZE=5)
+class KeysetPaginationTests(ContentTestCase):
+    volumes = {'menus': 2, 'submenus': 4}
+
+    def test_plain_list_is_capped(self):
+        response = self.client.get(SUBMENUS_URL)
+        self.assertEqual(len(response.json()), 5)
+        self.assertIn('rel="next"', response['Link'])
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(SUBMENUS_URL, {'page_size': 50})
+        self.assertEqual(len(response.json()), 5)
+
+    def test_pages_cover_the_list(self):
+        ids, url = [], SUBMENUS_URL + '?page_size=3'
+        while url:
+            response = self.client.get(url)
+            ids.extend(row['id'] for row in response.json())
+            url = response.get('Link', '').partition('>')[0][1:]
+        self.assertEqual(len(ids), 8)
+        self.assertEqual(len(set(ids)), 8)
+
+    def test_unbounded_opt_out(self):
+        with mock.patch.object(resolve(SUBMENUS_URL).func.cls, 'unbounded_list', True, create=True):
+            response = self.client.get(SUBMENUS_URL)
+        self.assertEqual(len(response.json()), 8)
+        self.assertFalse(response.has_header('Link'))
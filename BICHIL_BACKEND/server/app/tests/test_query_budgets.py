@@ -0,0 +1,40 @@
+from unittest import mock
+
+from django.test import override_settings
+
+from app.testing import ContentTestCase, QueryBudgetTestMixin, registered_viewsets
+
+
+class QueryBudgetTests(QueryBudgetTestMixin, ContentTestCase):
+
+    def test_every_endpoint_has_a_budget(self):
+        for prefix, viewset, _ in registered_viewsets():
+            with self.subTest(prefix=prefix):
+                self.assertEqual(set(viewset.query_budget), {'list', 'retrieve'})
+
+    def test_within_budget(self):
+        self.assertQueryBudgets()
+
+    def test_within_budget_with_language(self):
+        self.assertQueryBudgets(lang='en')
+
+    @override_settings(FAST_READS=True)
+    def test_values_reads_within_budget(self):
+        self.assertQueryBudgets()
+        self.assertQueryBudgets(lang='en')
+
+    def test_over_budget_fails(self):
+        _, viewset, _ = registered_viewsets()[0]
+        with mock.patch.object(viewset, 'query_budget', {'list': 0, 'retrieve': 0}):
+            with self.assertRaisesMessage(AssertionError, 'Query budget exceeded'):
+                self.assertQueryBudgets()
+
+
+class LargeContentQueryBudgetTests(QueryBudgetTestMixin, ContentTestCase):
+    """The same budgets with several times the rows: query counts must not grow with content."""
+
+    volumes = {'languages': 4, 'menus': 30, 'categories': 15, 'products': 40, 'cta': 15, 'slides': 15}
+
+    def test_within_budget(self):
+        self.assertQueryBudgets()
+        self.assertQueryBudgets(lang='en')
@@ -0,0 +1,86 @@
+from unittest import skipUnless
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from app import renderers
+from app.models.models import CategoryTranslations, CtaTitle, HeaderMenuTranslation
+from app.renderers import FastJSONRenderer
+from app.testing import API_PREFIX, ContentTestCase, check_read_parity, registered_viewsets
+from app.utils.cache import get_content_cache
+
+
+def render_both(data):
+    return FastJSONRenderer().render(data), JSONRenderer().render(data)
+
+
+@skipUnless(renderers.orjson, 'orjson is not installed')
+class FastJSONRendererTests(SimpleTestCase):
+
+    def test_matches_json(self):
+        data = [{
+            'label': 'Монгол "q" \\ 😀    </script>',
+            'numbers': [0, -1, 2 ** 53 + 1, 2 ** 64, 0.1, -0.0, 5e-324, 12345678.9],
+            'nested': {'true': True, 'none': None, 'empty': []},
+        }]
+        fast, expected = render_both(data)
+        self.assertEqual(fast, expected)
+
+    def test_large_and_small_floats(self):
+        for value in (1e15, 1e16, 1e22, 1.5e300, 123456789012345678.0, 1e-4, 1e-5, -2.5e-5, 1e-7, 1e-10):
+            with self.subTest(value=value):
+                fast, expected = render_both({'value': value})
+                self.assertEqual(fast, expected)
+
+    def test_exponent_like_strings(self):
+        fast, expected = render_both({'label': 'Model 3e-1', 'value': 1e16})
+        self.assertEqual(fast, expected)
+
+    def test_non_finite_floats_render_as_null(self):
+        data = {'nan': float('nan'), 'inf': [float('inf'), float('-inf')], 'big': 1e16}
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+        self.assertEqual(FastJSONRenderer().render(data), b'{"nan":null,"inf":[null,null],"big":1e16}')
+
+
+class EndpointParityTests(ContentTestCase):
+    volumes = {'menus': 3, 'submenus': 2, 'tertiaries': 2, 'categories': 2, 'products': 4, 'cta': 2, 'slides': 2}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Text that JSON encoders tend to disagree on.
+        HeaderMenuTranslation.objects.filter(pk=HeaderMenuTranslation.objects.order_by('pk')[0].pk).update(
+            label='Монгол   "q" \\ 😀  ',
+        )
+        CtaTitle.objects.update(label='</script> & ‘quotes’')
+        CategoryTranslations.objects.update(label='Зээл 1e-7')
+
+    def list_urls(self):
+        return [API_PREFIX + prefix + '/' for prefix, _, _ in registered_viewsets()] + [
+            API_PREFIX + 'bootstrap/',
+        ]
+
+    def test_renderers_match_per_endpoint(self):
+        for url in self.list_urls():
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                fast, expected = render_both(response.data)
+                self.assertEqual(fast, expected)
+                self.assertEqual(response.content, expected)
+
+    def test_values_reads_match_serializers(self):
+        checked, _, mismatches = check_read_parity()
+        self.assertTrue(checked)
+        self.assertEqual(mismatches, [])
+
+    def test_values_reads_match_per_endpoint(self):
+        for url in self.list_urls():
+            with self.subTest(url=url):
+                with override_settings(FAST_READS=False):
+                    get_content_cache().reset()
+                    expected = self.client.get(url).content
+                with override_settings(FAST_READS=True):
+                    get_content_cache().reset()
+                    self.assertEqual(self.client.get(url).content, expected)
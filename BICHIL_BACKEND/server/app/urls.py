@@ -1,31 +1,32 @@
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from app.views.headers import HeaderViewSet  
-from app.views.headersMenu import HeaderMenuViewSet
-from app.views.headersSubmenu import HeaderSubmenuViewSet
-from app.views.headersTertiaryMenu import HeaderTertiaryMenuViewSet
-from app.views.headerStyle import HeaderStyleViewSet
-from app.views.heroSlider import HeroSliderViewSet
-from app.views.cta import CtaViewSet
-from app.views.appDownloadList import AppDownloadListViewSet
-from app.views.appDownloadTitle import AppDownloadTitleViewSet
-from app.views.appDownload import AppDownloadViewSet
-from app.views.footer import FooterViewSet
+from app.utils.routing import LazyRouter, lazy_path
 
-
-router = DefaultRouter()
-router.register(r'headers', HeaderViewSet, basename='header')
-router.register(r'header-menu', HeaderMenuViewSet, basename='header-menu')
-router.register(r'header-submenu', HeaderSubmenuViewSet, basename='header-submenu')
-router.register(r'header-tertiary', HeaderTertiaryMenuViewSet, basename='header-tertiary')
-router.register(r'header-style', HeaderStyleViewSet, basename='header-style')
-router.register(r'hero-slider', HeroSliderViewSet, basename='hero-slider')
-router.register(r'CTA', CtaViewSet, basename='CTA')
-router.register(r'app-download-list', AppDownloadListViewSet, basename='app-download-list')
-router.register(r'app-download-title', AppDownloadTitleViewSet, basename='app-download-title')
-router.register(r'app-download', AppDownloadViewSet, basename='app-download')
-router.register(r'footer', FooterViewSet, basename='footer')
+# Views are given as dotted paths and imported on the first request that
+# reaches them, so loading the URLconf does not import every view and
+# serializer module up front.
+router = LazyRouter()
+router.register(r'headers', 'app.views.headers.HeaderViewSet', basename='header')
+router.register(r'header-menu', 'app.views.headersMenu.HeaderMenuViewSet', basename='header-menu')
+router.register(r'header-submenu', 'app.views.headersSubmenu.HeaderSubmenuViewSet', basename='header-submenu')
+router.register(r'header-tertiary', 'app.views.headersTertiaryMenu.HeaderTertiaryMenuViewSet', basename='header-tertiary')
+router.register(r'header-style', 'app.views.headerStyle.HeaderStyleViewSet', basename='header-style')
+router.register(r'hero-slider', 'app.views.heroSlider.HeroSliderViewSet', basename='hero-slider')
+router.register(r'CTA', 'app.views.cta.CtaViewSet', basename='CTA')
+router.register(r'app-download-list', 'app.views.appDownloadList.AppDownloadListViewSet', basename='app-download-list')
+router.register(r'app-download-title', 'app.views.appDownloadTitle.AppDownloadTitleViewSet', basename='app-download-title')
+router.register(r'app-download', 'app.views.appDownload.AppDownloadViewSet', basename='app-download')
+router.register(r'footer', 'app.views.footer.FooterViewSet', basename='footer')
 
 urlpatterns = [
-    path('', include(router.urls)),
+    lazy_path('bootstrap/', 'app.views.bootstrap.BootstrapView', name='bootstrap'),
+    lazy_path('async/bootstrap/', 'app.views.asyncContent.AsyncBootstrapView', name='async-bootstrap'),
+    lazy_path('async/<slug:section>/', 'app.views.asyncContent.AsyncSectionView', name='async-section'),
+    lazy_path('search/', 'app.views.search.SearchView', name='search'),
+    lazy_path('batch/', 'app.views.batch.BatchView', name='batch'),
+    lazy_path('snapshots/', 'app.views.snapshots.SnapshotManifestView', name='snapshot-manifest'),
+    lazy_path('snapshots/files/<str:filename>', 'app.views.snapshots.SnapshotFileView', name='snapshot-file'),
+    lazy_path('snapshots/<slug:name>/', 'app.views.snapshots.SnapshotView', name='snapshot'),
+    lazy_path('media/uploads/<path:name>', 'app.views.media.UploadFileView', name='media-upload'),
+    lazy_path('media/<str:filename>', 'app.views.media.MediaFileView', name='media-file'),
+    lazy_path('debug/query-stats/', 'app.views.debug.QueryStatsView', name='query-stats'),
+    *router.urls,
 ]
@@ -0,0 +1,346 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils.module_loading import import_string
+
+from app.publish import schedule_publish
+from app.utils.prefetch import get_prefetch_plan, plan_models
+
+
+def _now_version():
+    return int(time.time() * 1000)
+
+
+class DatabaseVersions:
+    """Content versions in the ``content_version`` table.
+
+    Shared by every worker and kept across restarts, so a write anywhere
+    invalidates cached reads and ETags everywhere. Each process re-reads the
+    table at most every ``ttl`` seconds, which bounds how long another
+    worker's write can go unnoticed; its own writes are seen at once.
+    """
+
+    shared = True
+
+    def __init__(self, ttl=1.0):
+        self.ttl = ttl
+        self._versions = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def get(self, names):
+        from app.models.models import ContentVersion
+
+        now = time.monotonic()
+        with self._lock:
+            versions, loaded_at = self._versions, self._loaded_at
+        if loaded_at is None or now - loaded_at >= self.ttl:
+            versions = dict(ContentVersion.objects.using(DEFAULT_DB_ALIAS).values_list('name', 'version'))
+            with self._lock:
+                self._versions, self._loaded_at = versions, now
+        return tuple(versions.get(name, 0) for name in names)
+
+    def bump(self, names):
+        from app.models.models import ContentVersion
+
+        versions = ContentVersion.objects.using(DEFAULT_DB_ALIAS)
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            versions.bulk_create([ContentVersion(name=name, version=0) for name in names], ignore_conflicts=True)
+            versions.filter(name__in=names).update(version=Greatest(F('version') + 1, Value(_now_version())))
+        with self._lock:
+            self._loaded_at = None
+
+
+class ContentCache:
+    """Size-bounded LRU store for serialized read models.
+
+    Entries are pickled on the way in, so ``max_bytes`` bounds real payload
+    size. Versions are per content type (model label) and only ever grow; they
+    are millisecond timestamps so they double as a last-modified time. They
+    live in ``versions`` (a DatabaseVersions, see CONTENT_VERSIONS) when set,
+    otherwise in the backend itself.
+    """
+
+    # Whether the backend's own versions are seen by every worker and
+    # survive a restart.
+    shared_versions = False
+
+    def __init__(self, max_entries=1000, max_bytes=64 * 1024 * 1024, versions=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.versions = versions
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def versions_shared(self):
+        return self.versions.shared if self.versions is not None else self.shared_versions
+
+    def get(self, key):
+        raw = self._get(key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(raw)
+
+    def set(self, key, value):
+        raw = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(raw) <= self.max_bytes:
+            self._set(key, raw)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'backend': type(self).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / total, 4) if total else None,
+            'entries': self._count(),
+        }
+
+    def get_versions(self, names):
+        if self.versions is not None:
+            return self.versions.get(names)
+        return self._get_versions(names)
+
+    def bump(self, names):
+        if self.versions is not None:
+            self.versions.bump(names)
+        else:
+            self._bump(names)
+
+    def _get_versions(self, names):
+        raise NotImplementedError
+
+    def _bump(self, names):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def reset(self):
+        """Drop every entry and load current versions.
+
+        The next read then runs only its own queries, which is what query
+        counts and routing checks want to see.
+        """
+        self.clear()
+        self.get_versions(())
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _set(self, key, raw):
+        raise NotImplementedError
+
+    def _count(self):
+        raise NotImplementedError
+
+
+class LocMemContentCache(ContentCache):
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._versions = {}
+
+    def _get(self, key):
+        with self._lock:
+            raw = self._entries.get(key)
+            if raw is not None:
+                self._entries.move_to_end(key)
+            return raw
+
+    def _set(self, key, raw):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = raw
+            self._bytes += len(raw)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def _count(self):
+        return len(self._entries)
+
+    def _get_versions(self, names):
+        return tuple(self._versions.get(name, 0) for name in names)
+
+    def _bump(self, names):
+        with self._lock:
+            for name in names:
+                self._versions[name] = max(self._versions.get(name, 0) + 1, _now_version())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class FileContentCache(ContentCache):
+    """Entries and versions on local disk, shared by every worker on the host.
+
+    Recency is tracked through file mtimes, which reads refresh.
+    """
+
+    shared_versions = True
+
+    def __init__(self, location, **options):
+        super().__init__(**options)
+        self.location = str(location)
+        self._entry_dir = os.path.join(self.location, 'entries')
+        self._version_dir = os.path.join(self.location, 'versions')
+        os.makedirs(self._entry_dir, exist_ok=True)
+        os.makedirs(self._version_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self._entry_dir, hashlib.sha1(key.encode()).hexdigest())
+
+    def _write(self, path, raw):
+        tmp = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+        with open(tmp, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp, path)
+
+    def _get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return raw
+
+    def _set(self, key, raw):
+        self._write(self._path(key), raw)
+        self._evict()
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self._entry_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if len(entries) <= self.max_entries and total <= self.max_bytes:
+            return
+        entries.sort()
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def _count(self):
+        return len(self._entries())
+
+    def _read_version(self, name):
+        try:
+            with open(os.path.join(self._version_dir, name), 'rb') as f:
+                return int(f.read() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _get_versions(self, names):
+        return tuple(self._read_version(name) for name in names)
+
+    def _bump(self, names):
+        with self._lock:
+            for name in names:
+                version = max(self._read_version(name) + 1, _now_version())
+                self._write(os.path.join(self._version_dir, name), str(version).encode())
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+_content_cache = None
+
+
+def get_content_cache():
+    """Return the process-wide content cache configured by ``CONTENT_CACHE``."""
+    global _content_cache
+    if _content_cache is None:
+        config = getattr(settings, 'CONTENT_CACHE', {})
+        backend = import_string(config.get('BACKEND', 'app.utils.cache.LocMemContentCache'))
+        versions = getattr(settings, 'CONTENT_VERSIONS', None)
+        if versions:
+            versions = import_string(versions['BACKEND'])(**versions.get('OPTIONS', {}))
+        _content_cache = backend(versions=versions or None, **config.get('OPTIONS', {}))
+    return _content_cache
+
+
+def content_type(model):
+    return model._meta.label_lower
+
+
+def dependent_models(model):
+    """Models whose rows point at ``model``, directly or through other dependents.
+
+    Deleting a row leaves the database to remove theirs (translations,
+    children), so their cached reads are stale too.
+    """
+    found, pending = [], [model]
+    while pending:
+        for relation in pending.pop()._meta.related_objects:
+            related = relation.related_model
+            if related is not model and related not in found:
+                found.append(related)
+                pending.append(related)
+    return found
+
+
+def bump_content_version(*models):
+    """Invalidate cached reads that depend on ``models`` once the write commits."""
+    names = sorted({content_type(model) for model in models})
+    transaction.on_commit(lambda: get_content_cache().bump(names))
+    schedule_publish()
+
+
+def serializer_content_types(serializer_class):
+    """Content types whose rows ``serializer_class`` reads."""
+    plan = get_prefetch_plan(serializer_class)
+    return sorted({content_type(model) for model in plan_models(serializer_class.Meta.model, plan)})
+
+
+def content_versions(serializer_classes):
+    names = sorted({name for cls in serializer_classes for name in serializer_content_types(cls)})
+    return tuple(zip(names, get_content_cache().get_versions(names)))
+
+
+def model_versions(models):
+    names = sorted({content_type(model) for model in models})
+    return tuple(zip(names, get_content_cache().get_versions(names)))
+
+
+def cache_key(*parts):
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
@@ -0,0 +1,112 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from app.renderers import FastJSONRenderer
+from app.utils.cache import cache_key, get_content_cache
+from app.utils.language import add_language_vary
+
+
+def version_etag(key):
+    """Strong ETag for a read identified by ``key`` (which embeds content versions)."""
+    return '"%s"' % key
+
+
+def payload_etag(data):
+    """Strong ETag from the rendered ``data``, for when versions are not shared."""
+    return '"%s"' % hashlib.blake2b(FastJSONRenderer().render(data), digest_size=16).hexdigest()
+
+
+def version_last_modified(versions):
+    """Last-Modified timestamp from millisecond content versions, None if unknown."""
+    latest = max((version for _, version in versions), default=0)
+    return latest // 1000 if latest else None
+
+
+def conditional_response(request, etag, last_modified):
+    """Return a 304 response if the client's validators still match, else None."""
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    # Let browsers and the CDN store the payload but revalidate every use.
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+def _read_validators(name, language, versions):
+    """``(key, etag, last_modified)``; the validators are None without shared versions.
+
+    Versions kept by one process say nothing about what another worker, or
+    this one before a restart, served under the same numbers.
+    """
+    key = cache_key(name, language.id if language is not None else None, versions)
+    if not get_content_cache().versions_shared:
+        return key, None, None
+    return key, version_etag(key), version_last_modified(versions)
+
+
+def versioned_response(request, name, language, versions, build):
+    """Cached, revalidatable response for a read that depends on ``versions``.
+
+    ``build`` is only called on a cache miss for a client without a matching
+    ETag. The response varies on Accept-Language.
+    """
+    key, etag, last_modified = _read_validators(name, language, versions)
+
+    if etag is not None:
+        response = conditional_response(request, etag, last_modified)
+        if response is not None:
+            return add_language_vary(response)
+
+    cache = get_content_cache()
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data)
+    if etag is None:
+        etag = payload_etag(data)
+        response = conditional_response(request, etag, None)
+        if response is not None:
+            return add_language_vary(response)
+    return add_language_vary(set_validators(Response(data), etag, last_modified))
+
+
+def json_response(data, status=200):
+    """Plain Django response rendered exactly like DRF's JSON output."""
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type='application/json')
+
+
+async def aversioned_response(request, name, language, versions, build):
+    """Async ``versioned_response`` for plain Django views; ``build`` is a coroutine function.
+
+    Shares cache entries with the sync read of the same ``name``.
+    """
+    key, etag, last_modified = _read_validators(name, language, versions)
+
+    if etag is not None:
+        response = conditional_response(request, etag, last_modified)
+        if response is not None:
+            return add_language_vary(response)
+
+    cache = get_content_cache()
+    data = await sync_to_async(cache.get)(key)
+    if data is None:
+        data = await build()
+        await sync_to_async(cache.set)(key, data)
+    if etag is None:
+        etag = payload_etag(data)
+        response = conditional_response(request, etag, None)
+        if response is not None:
+            return add_language_vary(response)
+    return add_language_vary(set_validators(json_response(data), etag, last_modified))
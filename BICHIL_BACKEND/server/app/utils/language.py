@@ -0,0 +1,166 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import patch_vary_headers
+from rest_framework.exceptions import ValidationError
+
+from app.models.models import Language
+
+# ?lang=all explicitly asks for every translation.
+ALL_LANGUAGES = 'all'
+
+# A lookup that misses reloads the table, at most this often.
+MISS_RELOAD_INTERVAL = 1.0
+
+
+def registry_ttl():
+    return getattr(settings, 'LANGUAGE_REGISTRY_TTL', 60)
+
+
+class LanguageRegistry:
+    """Every Language row in memory, by id and by lowercased lang_code.
+
+    Loaded on first use and reloaded when a Language is saved or deleted in
+    this process, after LANGUAGE_REGISTRY_TTL seconds (rows edited elsewhere)
+    and when a lookup misses (a language added elsewhere). The instances are
+    shared; treat them as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id = {}
+        self._by_code = {}
+        self._loaded_at = None
+
+    def _load(self):
+        languages = list(Language.objects.order_by('id'))
+        by_code = {}
+        for language in languages:
+            by_code.setdefault((language.lang_code or '').lower(), language)
+        with self._lock:
+            self._by_id = {language.pk: language for language in languages}
+            self._by_code = by_code
+            self._loaded_at = time.monotonic()
+
+    def _refresh(self, missed=False):
+        loaded_at = self._loaded_at
+        age = time.monotonic() - loaded_at if loaded_at is not None else None
+        if age is None or age > registry_ttl() or (missed and age > MISS_RELOAD_INTERVAL):
+            self._load()
+
+    def get(self, pk):
+        self._refresh()
+        language = self._by_id.get(pk)
+        if language is None:
+            self._refresh(missed=True)
+            language = self._by_id.get(pk)
+        return language
+
+    def by_code(self, lang_code):
+        lang_code = (lang_code or '').lower()
+        self._refresh()
+        language = self._by_code.get(lang_code)
+        if language is None:
+            self._refresh(missed=True)
+            language = self._by_code.get(lang_code)
+        return language
+
+    def codes(self):
+        """lowercased lang_code -> Language."""
+        self._refresh()
+        return self._by_code
+
+    def all(self):
+        self._refresh()
+        return list(self._by_id.values())
+
+    def clear(self):
+        with self._lock:
+            self._loaded_at = None
+
+
+_registry = LanguageRegistry()
+
+
+def get_language_registry():
+    return _registry
+
+
+def _on_language_changed(sender, **kwargs):
+    _registry.clear()
+
+
+post_save.connect(_on_language_changed, sender=Language, dispatch_uid='app.language.saved')
+post_delete.connect(_on_language_changed, sender=Language, dispatch_uid='app.language.deleted')
+
+
+def get_language(lang_code):
+    """Return the Language for ``lang_code``, None when no code is given."""
+    if not lang_code or lang_code.lower() == ALL_LANGUAGES:
+        return None
+    language = _registry.by_code(lang_code)
+    if language is None:
+        raise ValidationError({'lang': 'Unknown language "%s".' % lang_code})
+    return language
+
+
+def parse_accept_language(header):
+    """Return the language tags of an Accept-Language header, best first."""
+    tags = []
+    for position, part in enumerate(header.split(',')):
+        tag, _, params = part.strip().partition(';')
+        tag = tag.strip().lower()
+        if not tag or tag == '*':
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            tags.append((-quality, position, tag))
+    return [tag for _, _, tag in sorted(tags)]
+
+
+def match_accept_language(header):
+    """Return the best Language for an Accept-Language header, or None."""
+    tags = parse_accept_language(header or '')
+    if not tags:
+        return None
+    languages = _registry.codes()
+    for tag in tags:
+        language = languages.get(tag) or languages.get(tag.split('-')[0])
+        if language is not None:
+            return language
+    return None
+
+
+def negotiate_language(request, accept_language=True):
+    """Resolve the content language of ``request``.
+
+    An explicit ``?lang=`` always wins; otherwise the Accept-Language header is
+    used when ``accept_language`` is set. None means "all languages".
+    """
+    # Plain Django requests (the async views) have no query_params.
+    lang_code = getattr(request, 'query_params', request.GET).get('lang')
+    if lang_code:
+        return get_language(lang_code)
+    if accept_language:
+        return match_accept_language(request.META.get('HTTP_ACCEPT_LANGUAGE'))
+    return None
+
+
+def negotiates_accept_language():
+    # Off by default: the admin app reads these routes from a browser and
+    # needs every translation, whatever Accept-Language it sends.
+    return getattr(settings, 'NEGOTIATE_CONTENT_LANGUAGE', False)
+
+
+def add_language_vary(response):
+    patch_vary_headers(response, ('Accept-Language',))
+    return response
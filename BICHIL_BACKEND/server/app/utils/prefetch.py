@@ -0,0 +1,146 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from django.db.models import Prefetch
+from django.db.models.fields.related import ForeignObjectRel
+from rest_framework import serializers
+
+# select: select_related lookups, prefetch: (source, related model, child plan),
+# extra: raw prefetch_related lookups declared on the serializer.
+PrefetchPlan = namedtuple('PrefetchPlan', ['select', 'prefetch', 'extra'])
+
+
+def model_relation(model, name):
+    for field in model._meta.get_fields():
+        if isinstance(field, ForeignObjectRel):
+            if field.get_accessor_name() == name:
+                return field
+        elif field.name == name and field.is_relation:
+            return field
+    return None
+
+
+def _is_forward(relation):
+    return relation is not None and not isinstance(relation, ForeignObjectRel) and (
+        relation.many_to_one or relation.one_to_one
+    )
+
+
+def _select_path(model, source_attrs):
+    path = []
+    for attr in source_attrs[:-1]:
+        relation = model_relation(model, attr)
+        if not _is_forward(relation):
+            break
+        path.append(attr)
+        model = relation.related_model
+    return '__'.join(path)
+
+
+def _build_plan(serializer):
+    model = serializer.Meta.model
+    select, prefetch, extra = [], [], []
+
+    for lookup in getattr(serializer, 'prefetch_related', ()):
+        relation = model_relation(model, lookup)
+        if relation is not None and not _is_forward(relation):
+            prefetch.append((lookup, relation.related_model, PrefetchPlan((), (), ())))
+        else:
+            extra.append(lookup)
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+
+        if isinstance(field, serializers.ListSerializer):
+            relation = model_relation(model, field.source)
+            if relation is not None and isinstance(field.child, serializers.ModelSerializer):
+                prefetch.append((field.source, relation.related_model, _build_plan(field.child)))
+            continue
+
+        if isinstance(field, serializers.ModelSerializer):
+            relation = model_relation(model, field.source)
+            if _is_forward(relation):
+                child = _build_plan(field)
+                select.append(field.source)
+                select.extend('%s__%s' % (field.source, lookup) for lookup in child.select)
+                extra.extend('%s__%s' % (field.source, lookup) for lookup in child.extra)
+                extra.extend('%s__%s' % (field.source, source) for source, _, _ in child.prefetch)
+            continue
+
+        if isinstance(field, serializers.ManyRelatedField):
+            extra.append(field.source)
+            continue
+
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            # Reads <fk>_id directly, no join needed.
+            continue
+
+        if isinstance(field, serializers.RelatedField):
+            if _is_forward(model_relation(model, field.source)):
+                select.append(field.source)
+            continue
+
+        if len(field.source_attrs) > 1:
+            path = _select_path(model, field.source_attrs)
+            if path:
+                select.append(path)
+
+    return PrefetchPlan(tuple(dict.fromkeys(select)), tuple(prefetch), tuple(dict.fromkeys(extra)))
+
+
+@lru_cache(maxsize=None)
+def get_prefetch_plan(serializer_class):
+    """Walk the (nested) fields of ``serializer_class`` and return its PrefetchPlan."""
+    return _build_plan(serializer_class())
+
+
+def _related_queryset(model, plan, language):
+    # Ordered so nested lists come out the same on every database.
+    queryset = model._default_manager.order_by('pk')
+    if language is not None and model_relation(model, 'language') is not None:
+        queryset = queryset.filter(language=language)
+    return _apply(queryset, plan, language)
+
+
+def _apply(queryset, plan, language=None):
+    if plan.select:
+        queryset = queryset.select_related(*plan.select)
+    lookups = [
+        Prefetch(source, queryset=_related_queryset(model, child, language))
+        for source, model, child in plan.prefetch
+    ]
+    lookups.extend(plan.extra)
+    if lookups:
+        queryset = queryset.prefetch_related(*lookups)
+    return queryset
+
+
+def apply_prefetch_plan(queryset, serializer_class, language=None):
+    """Return ``queryset`` with the select_related/Prefetch lookups ``serializer_class`` needs.
+
+    When ``language`` is given, prefetched rows that carry a ``language`` column
+    (the *Translation tables) are limited to that language.
+    """
+    return _apply(queryset, get_prefetch_plan(serializer_class), language)
+
+
+def _path_models(model, lookup):
+    models = []
+    for attr in lookup.split('__'):
+        relation = model_relation(model, attr)
+        if relation is None:
+            break
+        model = relation.related_model
+        models.append(model)
+    return models
+
+
+def plan_models(model, plan):
+    """Every model a queryset built from ``plan`` reads, starting at ``model``."""
+    models = {model}
+    for lookup in plan.select + plan.extra:
+        models.update(_path_models(model, lookup))
+    for _, related_model, child in plan.prefetch:
+        models.update(plan_models(related_model, child))
+    return models
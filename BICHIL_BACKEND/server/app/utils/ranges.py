@@ -0,0 +1,127 @@
+import mimetypes
+import os
+import re
+
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+
+# Content-hashed or timestamp-named files never change, so they can be
+# cached for a year.
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFileWrapper:
+    """Read ``length`` bytes of ``file`` from ``offset`` on.
+
+    Keeps ``fileno()`` and leaves the file positioned at ``offset``, so
+    servers whose wsgi.file_wrapper uses sendfile (gunicorn) send the range
+    bounded by Content-Length without copying it through Python.
+    """
+
+    def __init__(self, file, offset, length):
+        self.file = file
+        self.remaining = length
+        file.seek(offset)
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """``(start, end)`` inclusive for a single ``bytes=`` range.
+
+    None when the header should be ignored (absent, malformed or several
+    ranges, which are answered with the whole file); ValueError when the
+    range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.replace(' ', '')) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # Suffix range: the last N bytes.
+        suffix = int(last)
+        if suffix == 0:
+            raise ValueError
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError
+    return start, end
+
+
+def _if_range_matches(request, etag, last_modified):
+    value = request.META.get('HTTP_IF_RANGE')
+    if not value:
+        return True
+    if value.startswith('"'):
+        return value == etag
+    if value.startswith('W/'):
+        return False
+    return parse_http_date_safe(value) == last_modified
+
+
+def file_response(request, path, content_type=None, immutable=False):
+    """Serve ``path`` with validators and single-range ``206`` responses.
+
+    A ``Range`` request gets just those bytes, unless ``If-Range`` names an
+    older version of the file, in which case the whole file is sent.
+    """
+    try:
+        file = open(path, 'rb')
+    except (FileNotFoundError, IsADirectoryError):
+        raise Http404
+    stat = os.fstat(file.fileno())
+    size, last_modified = stat.st_size, int(stat.st_mtime)
+    etag = '"%x-%x"' % (stat.st_mtime_ns, size)
+    content_type = content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        try:
+            byte_range = None
+            if _if_range_matches(request, etag, last_modified):
+                byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+        except ValueError:
+            file.close()
+            response = HttpResponse(status=416)
+            response['Content-Range'] = 'bytes */%d' % size
+            return response
+
+        if byte_range is None:
+            response = FileResponse(file, content_type=content_type)
+        else:
+            start, end = byte_range
+            response = FileResponse(RangeFileWrapper(file, start, end - start + 1), content_type=content_type)
+            response.status_code = 206
+            response['Content-Length'] = end - start + 1
+            response['Content-Range'] = 'bytes %d-%d/%d' % (start, end, size)
+    else:
+        file.close()
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    if immutable:
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    return response
@@ -0,0 +1,67 @@
+from django.urls import URLResolver, path
+from django.urls.resolvers import RegexPattern
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from rest_framework.routers import DefaultRouter
+from rest_framework.urlpatterns import format_suffix_patterns
+
+
+class LazyResolver(URLResolver):
+    """URLResolver whose patterns are built by ``build`` on first resolve or reverse.
+
+    ``prefix`` is a regex the path must start with; it is matched as a
+    lookahead, so the built patterns see (and match) the whole path.
+    """
+
+    def __init__(self, prefix, target, build):
+        super().__init__(RegexPattern('^(?=%s)' % prefix), target)
+        self._build = build
+
+    @cached_property
+    def urlconf_module(self):
+        return self._build()
+
+
+def lazy_path(route, view, name=None):
+    """``path(route, view.as_view())`` that imports ``view`` (a dotted path) on first hit."""
+    def build():
+        return [path(route, import_string(view).as_view(), name=name)]
+    return LazyResolver(route.split('<')[0].replace('.', r'\.'), view, build)
+
+
+class LazyRouter(DefaultRouter):
+    """DefaultRouter that takes viewsets as dotted paths and imports each on its first hit.
+
+    Every registration gets its own LazyResolver, so serving one endpoint
+    imports only that viewset's module. The API root view needs only the
+    prefixes and basenames.
+    """
+
+    def get_default_basename(self, viewset):
+        return super().get_default_basename(self._resolve(viewset))
+
+    @staticmethod
+    def _resolve(viewset):
+        return import_string(viewset) if isinstance(viewset, str) else viewset
+
+    def viewsets(self):
+        """``(prefix, viewset, basename)`` for every registration, importing the viewsets."""
+        return [(prefix, self._resolve(viewset), basename) for prefix, viewset, basename in self.registry]
+
+    def _lazy_urls(self, prefix, viewset, basename):
+        def build():
+            router = DefaultRouter(trailing_slash=bool(self.trailing_slash))
+            router.include_root_view = False
+            router.include_format_suffixes = self.include_format_suffixes
+            router.register(prefix, self._resolve(viewset), basename)
+            return router.urls
+        return LazyResolver('%s[/.]' % prefix, viewset, build)
+
+    def get_urls(self):
+        urls = [self._lazy_urls(*registration) for registration in self.registry]
+        if self.include_root_view:
+            root = [path('', self.get_api_root_view(api_urls=urls), name=self.root_view_name)]
+            if self.include_format_suffixes:
+                root = format_suffix_patterns(root)
+            urls.extend(root)
+        return urls
@@ -0,0 +1,68 @@
+from django.db import transaction
+from django.dispatch import Signal
+
+# Sent on commit with sender=<translation model> and parent_ids=[...]
+# whenever sync_translations changed rows.
+translations_changed = Signal()
+
+
+def _language_id(language):
+    if isinstance(language, dict):
+        language = language.get('id')
+    return getattr(language, 'pk', language)
+
+
+def sync_translations(model, parent_field, parent, rows, delete_missing=True, new_parent=False):
+    """Make ``parent``'s ``model`` rows match ``rows``, one row per language.
+
+    ``rows`` are validated translation dicts holding a ``language`` plus the
+    translated columns. Existing rows are diffed by language and the result is
+    applied with at most one SELECT, DELETE, UPDATE and INSERT, so primary keys
+    of unchanged languages survive. Languages missing from ``rows`` are removed
+    unless ``delete_missing`` is False; duplicate rows for one language are
+    always collapsed.
+    """
+    incoming = {}
+    for row in rows:
+        values = dict(row)
+        incoming[_language_id(values.pop('language'))] = values
+    fields = sorted({field for values in incoming.values() for field in values})
+
+    with transaction.atomic():
+        existing, stale = {}, []
+        if not new_parent:
+            for obj in model.objects.filter(**{parent_field: parent}).order_by('id'):
+                if obj.language_id in existing:
+                    stale.append(obj.pk)
+                else:
+                    existing[obj.language_id] = obj
+
+        to_create, to_update = [], []
+        for language_id, values in incoming.items():
+            obj = existing.get(language_id)
+            if obj is None:
+                to_create.append(model(**{parent_field: parent, 'language_id': language_id}, **values))
+                continue
+            changed = False
+            for field, value in values.items():
+                if getattr(obj, field) != value:
+                    setattr(obj, field, value)
+                    changed = True
+            if changed:
+                to_update.append(obj)
+
+        if delete_missing:
+            stale.extend(obj.pk for language_id, obj in existing.items() if language_id not in incoming)
+
+        if stale:
+            model.objects.filter(pk__in=stale).delete()
+        if to_update:
+            model.objects.bulk_update(to_update, fields)
+        if to_create:
+            model.objects.bulk_create(to_create)
+
+        if stale or to_update or to_create:
+            parent_ids = [parent.pk]
+            transaction.on_commit(
+                lambda: translations_changed.send(sender=model, parent_ids=parent_ids), robust=True,
+            )
@@ -0,0 +1,119 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.fields.related import ForeignObjectRel
+from rest_framework import serializers
+
+from app.utils.prefetch import model_relation
+
+# fields: (output name, values() lookup, to_representation or None, child)
+# in serializer field order; child is (fk lookup on the child model, ValuesPlan)
+# for nested lists and None for columns.
+ValuesPlan = namedtuple('ValuesPlan', ['model', 'fields'])
+
+
+def values_reads_enabled():
+    return getattr(settings, 'FAST_READS', False)
+
+
+def _build_values_plan(serializer):
+    model = serializer.Meta.model
+    fields = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if isinstance(field, serializers.ListSerializer) and isinstance(field.child, serializers.ModelSerializer):
+            relation = model_relation(model, field.source)
+            if not isinstance(relation, ForeignObjectRel) or not relation.one_to_many:
+                raise ImproperlyConfigured('%s.%s is not a reverse foreign key' % (model.__name__, field.source))
+            fields.append((name, None, None, (relation.field.name, _build_values_plan(field.child))))
+        elif isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+            # Renders the raw foreign key value.
+            fields.append((name, field.source, None, None))
+        elif isinstance(field, (serializers.BaseSerializer, serializers.RelatedField,
+                                serializers.ManyRelatedField, serializers.SerializerMethodField)) \
+                or field.source == '*':
+            raise ImproperlyConfigured(
+                '%s.%s (%s) has no values() equivalent' % (type(serializer).__name__, name, type(field).__name__)
+            )
+        else:
+            fields.append((name, '__'.join(field.source_attrs), field.to_representation, None))
+    return ValuesPlan(model, tuple(fields))
+
+
+@lru_cache(maxsize=None)
+def get_values_plan(serializer_class):
+    """ValuesPlan that reproduces ``serializer_class``'s read output from values() rows.
+
+    Raises ImproperlyConfigured for fields that need model instances.
+    """
+    return _build_values_plan(serializer_class())
+
+
+@lru_cache(maxsize=None)
+def supports_values_read(serializer_class):
+    try:
+        get_values_plan(serializer_class)
+    except ImproperlyConfigured:
+        return False
+    return True
+
+
+def _lookups(plan, extra=()):
+    lookups = [plan.model._meta.pk.name]
+    lookups.extend(lookup for _, lookup, _, child in plan.fields if child is None)
+    lookups.extend(extra)
+    return list(dict.fromkeys(lookups))
+
+
+def values_queryset(queryset, serializer_class, extra=()):
+    """``queryset`` as values() rows carrying every column the top level needs."""
+    plan = get_values_plan(serializer_class)
+    return queryset.prefetch_related(None).values(*_lookups(plan, extra))
+
+
+def _children(fk, plan, parent_ids, language):
+    queryset = plan.model._default_manager.filter(**{'%s__in' % fk: parent_ids})
+    if language is not None and model_relation(plan.model, 'language') is not None:
+        queryset = queryset.filter(language=language)
+    rows = list(queryset.order_by('pk').values(*_lookups(plan, (fk,))))
+    grouped = {}
+    for row, item in zip(rows, _serialize(plan, rows, language)):
+        grouped.setdefault(row[fk], []).append(item)
+    return grouped
+
+
+def _serialize(plan, rows, language):
+    rows = list(rows)
+    pk = plan.model._meta.pk.name
+    parent_ids = [row[pk] for row in rows]
+    nested = {
+        name: _children(child[0], child[1], parent_ids, language) if parent_ids else {}
+        for name, _, _, child in plan.fields if child is not None
+    }
+
+    items = []
+    for row in rows:
+        item = {}
+        for name, lookup, to_representation, child in plan.fields:
+            if child is not None:
+                item[name] = nested[name].get(row[pk], [])
+                continue
+            value = row[lookup]
+            if value is not None and to_representation is not None:
+                value = to_representation(value)
+            item[name] = value
+        items.append(item)
+    return items
+
+
+def build_values(rows, serializer_class, language=None):
+    """Serialize values() rows like ``serializer_class(..., many=True).data``.
+
+    One query per nested level, the same as the prefetch plan, but without
+    model instances or serializer field objects per row.
+    """
+    return _serialize(get_values_plan(serializer_class), rows, language)
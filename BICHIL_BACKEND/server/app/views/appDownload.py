@@ -1,9 +1,10 @@
-from rest_framework import viewsets
+from app.views.base import ContentViewSet
 from app.models.models import AppDownload
 from app.serializers.appDownload import AppDownloadReadSerializer, AppDownloadWriteSerializer
 
-class AppDownloadViewSet(viewsets.ModelViewSet):
+class AppDownloadViewSet(ContentViewSet):
     queryset = AppDownload.objects.all()
+    query_budget = {'list': 6, 'retrieve': 6}
 
     def get_serializer_class(self):
         if self.action in ['list', 'retrieve']:
@@ -1,7 +1,8 @@
-from rest_framework import viewsets
+from app.views.base import ContentViewSet
 from app.models.models import AppDownloadList
 from app.serializers.appDownloadList import AppDownloadListSerializer
 
-class AppDownloadListViewSet(viewsets.ModelViewSet):
+class AppDownloadListViewSet(ContentViewSet):
     queryset = AppDownloadList.objects.all()
+    query_budget = {'list': 2, 'retrieve': 2}
     serializer_class = AppDownloadListSerializer
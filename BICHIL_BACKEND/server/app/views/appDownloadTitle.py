@@ -1,7 +1,8 @@
-from rest_framework import viewsets
+from app.views.base import ContentViewSet
 from app.models.models import AppDownloadTitle
 from app.serializers.appDownloadTitle import AppDownloadTitleSerializer
 
-class AppDownloadTitleViewSet(viewsets.ModelViewSet):
+class AppDownloadTitleViewSet(ContentViewSet):
     queryset = AppDownloadTitle.objects.all()
+    query_budget = {'list': 3, 'retrieve': 3}
     serializer_class = AppDownloadTitleSerializer
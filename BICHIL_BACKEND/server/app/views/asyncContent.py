@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import ExitStack
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import Http404
+from django.views import View
+from rest_framework.exceptions import ValidationError
+
+from app.middleware import request_metrics
+from app.utils.cache import content_versions
+from app.utils.conditional import aversioned_response, json_response
+from app.utils.language import negotiate_language
+from app.views.bootstrap import SECTION_SERIALIZERS, SECTIONS, build_section
+
+# URL slug -> bootstrap section.
+SECTIONS_BY_SLUG = {section[0].replace('_', '-'): section for section in SECTIONS}
+
+
+def _build_section(queryset, serializer_class, many, language):
+    """``build_section`` on this thread's own connection, recycled like a request's."""
+    close_old_connections()
+    try:
+        with ExitStack() as stack:
+            metrics = request_metrics.get()
+            if metrics is not None:
+                metrics.install(stack)
+            return build_section(queryset, serializer_class, many, language)
+    finally:
+        close_old_connections()
+
+
+async def abuild_section(queryset, serializer_class, many, language=None):
+    """Async ``build_section``, run on a worker thread with its own connection.
+
+    The async ORM runs every query of the process on one shared thread, and so
+    on one connection at a time. Here each section queries in parallel, with
+    other sections and other requests; a bootstrap read can hold up to one
+    connection per section.
+    """
+    return await sync_to_async(_build_section, thread_sensitive=False)(queryset, serializer_class, many, language)
+
+
+async def abuild_bootstrap(language=None):
+    """Async ``build_bootstrap``: the sections are fetched in parallel."""
+    results = await asyncio.gather(*(
+        abuild_section(queryset, serializer_class, many, language)
+        for _, queryset, serializer_class, many in SECTIONS
+    ))
+    data = {'language': language.lang_code if language is not None else None}
+    data.update(zip((key for key, _, _, _ in SECTIONS), results))
+    return data
+
+
+class AsyncContentView(View):
+    http_method_names = ['get', 'head', 'options']
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            language = await sync_to_async(negotiate_language)(request)
+        except ValidationError as exc:
+            return json_response(exc.detail, status=400)
+        return await self.read(request, language, *args, **kwargs)
+
+
+class AsyncBootstrapView(AsyncContentView):
+
+    async def read(self, request, language):
+        versions = await sync_to_async(content_versions)(SECTION_SERIALIZERS)
+        return await aversioned_response(
+            request, 'bootstrap', language, versions, lambda: abuild_bootstrap(language),
+        )
+
+
+class AsyncSectionView(AsyncContentView):
+
+    async def read(self, request, language, section):
+        if section not in SECTIONS_BY_SLUG:
+            raise Http404
+        key, queryset, serializer_class, many = SECTIONS_BY_SLUG[section]
+        versions = await sync_to_async(content_versions)((serializer_class,))
+        return await aversioned_response(
+            request, 'section:%s' % key, language, versions,
+            lambda: abuild_section(queryset, serializer_class, many, language),
+        )
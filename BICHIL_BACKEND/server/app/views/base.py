@@ -0,0 +1,14 @@
+from rest_framework import viewsets
+from app.views.mixins import (
+    CachedReadMixin, ConditionalGetMixin, LanguageMixin, PrefetchMixin, QueryMetricsMixin,
+    ValuesReadMixin,
+)
+
+
+class ContentViewSet(
+    ConditionalGetMixin, CachedReadMixin, QueryMetricsMixin, ValuesReadMixin,
+    LanguageMixin, PrefetchMixin, viewsets.ModelViewSet,
+):
+    # Queries allowed per action with an empty content cache; checked by
+    # app.testing.check_query_budgets.
+    query_budget = {}
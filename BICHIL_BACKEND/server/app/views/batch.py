@@ -0,0 +1,89 @@
+import io
+import json
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app.serializers.batch import BatchSerializer
+
+# Request headers a sub-request must not inherit from the batch request.
+_DROPPED_META = ('CONTENT_TYPE', 'CONTENT_LENGTH', 'HTTP_RANGE', 'HTTP_IF_RANGE')
+
+
+def _sub_request(request, method, path, body):
+    url = urlsplit(path)
+    raw = json.dumps(body).encode() if body is not None else b''
+    environ = {
+        key: value for key, value in request.META.items()
+        if key not in _DROPPED_META and not key.startswith(('HTTP_IF_', 'wsgi.'))
+    }
+    environ.update({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': url.path,
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': url.query,
+        'HTTP_ACCEPT': 'application/json',
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(raw)),
+        'wsgi.input': io.BytesIO(raw),
+    })
+    sub_request = WSGIRequest(environ)
+    # Set by middleware on the batch request only.
+    for attr in ('session', 'user'):
+        if hasattr(request, attr):
+            setattr(sub_request, attr, getattr(request, attr))
+    return sub_request
+
+
+def _result(response):
+    if hasattr(response, 'data'):
+        body = response.data
+    elif not response.streaming and response.get('Content-Type', '').startswith('application/json') and response.content:
+        body = json.loads(response.content)
+    else:
+        body = None
+    return {'status': response.status_code, 'body': body}
+
+
+class BatchView(APIView):
+    """Run an ordered list of API sub-requests in one transaction.
+
+    Each operation is a write ``{"method", "path", "body"}`` against the
+    regular /api/v1/ routes, all on this request's DB connection. The first operation answering 4xx/5xx rolls back every
+    write and stops the batch; the response then carries the index of the
+    failed operation. Content caches are bumped once, when the batch commits.
+    """
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        operations = serializer.validated_data['operations']
+
+        matches = []
+        for index, operation in enumerate(operations):
+            try:
+                match = resolve(urlsplit(operation['path']).path)
+            except Resolver404:
+                raise ValidationError({'operations': {index: {'path': ['No route for this path.']}}})
+            if getattr(match.func, 'view_class', None) is BatchView or iscoroutinefunction(match.func):
+                raise ValidationError({'operations': {index: {'path': ['This route cannot be batched.']}}})
+            matches.append(match)
+
+        results = []
+        with transaction.atomic():
+            for index, (operation, match) in enumerate(zip(operations, matches)):
+                sub_request = _sub_request(request, operation['method'], operation['path'], operation.get('body'))
+                sub_request.resolver_match = match
+                result = _result(match.func(sub_request, *match.args, **match.kwargs))
+                results.append(result)
+                if result['status'] >= 400:
+                    transaction.set_rollback(True)
+                    return Response({'failed': index, 'results': results}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': results})
@@ -0,0 +1,62 @@
+from rest_framework.views import APIView
+
+from app.models.models import AppDownload, Category, Cta, Footer, Header, HeroSlider
+from app.serializers.appDownload import AppDownloadReadSerializer
+from app.serializers.cta import CtaSerializer
+from app.serializers.footer import FooterSerializer
+from app.serializers.headers import HeaderSerializer
+from app.serializers.heroSlider import HeroSliderSerializer
+from app.categories.serializers.read import CategoryReadSerializer
+from app.utils.cache import content_versions
+from app.utils.conditional import versioned_response
+from app.utils.language import negotiate_language
+from app.utils.prefetch import apply_prefetch_plan
+from app.utils.values import build_values, supports_values_read, values_queryset, values_reads_enabled
+
+
+# (key, queryset, serializer, many) for every public site-shell section.
+SECTIONS = (
+    ('header', Header.objects.filter(active=1).order_by('id'), HeaderSerializer, False),
+    ('hero_slider', HeroSlider.objects.filter(visible=True).order_by('index', 'id'), HeroSliderSerializer, True),
+    ('cta', Cta.objects.order_by('index', 'id'), CtaSerializer, True),
+    ('app_download', AppDownload.objects.order_by('id'), AppDownloadReadSerializer, False),
+    ('footer', Footer.objects.order_by('id'), FooterSerializer, False),
+    ('categories', Category.objects.order_by('id'), CategoryReadSerializer, True),
+)
+
+SECTION_SERIALIZERS = tuple(serializer_class for _, _, serializer_class, _ in SECTIONS)
+
+
+def section_queryset(queryset, serializer_class, language=None):
+    # .all() so the module-level querysets above are never evaluated in place.
+    return apply_prefetch_plan(queryset.all(), serializer_class, language)
+
+
+def build_section(queryset, serializer_class, many, language=None):
+    if values_reads_enabled() and supports_values_read(serializer_class):
+        rows = values_queryset(queryset.all(), serializer_class)
+        data = build_values(rows if many else rows[:1], serializer_class, language)
+        return data if many else (data[0] if data else None)
+    queryset = section_queryset(queryset, serializer_class, language)
+    if many:
+        return serializer_class(queryset, many=True).data
+    instance = queryset.first()
+    return serializer_class(instance).data if instance is not None else None
+
+
+def build_bootstrap(language=None):
+    """Serialize every public site-shell section, optionally for one language."""
+    data = {'language': language.lang_code if language is not None else None}
+    for key, queryset, serializer_class, many in SECTIONS:
+        data[key] = build_section(queryset, serializer_class, many, language)
+    return data
+
+
+class BootstrapView(APIView):
+
+    def get(self, request):
+        language = negotiate_language(request)
+        return versioned_response(
+            request, 'bootstrap', language, content_versions(SECTION_SERIALIZERS),
+            lambda: build_bootstrap(language),
+        )
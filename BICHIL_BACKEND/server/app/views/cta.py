@@ -1,8 +1,9 @@
-from rest_framework.viewsets import ModelViewSet
 from app.models.models import Cta
+from app.views.base import ContentViewSet
 from app.serializers.cta import CtaSerializer
 
-class CtaViewSet(ModelViewSet):
+class CtaViewSet(ContentViewSet):
 
     queryset = Cta.objects.all().order_by("index")
+    query_budget = {'list': 3, 'retrieve': 3}
     serializer_class = CtaSerializer
@@ -0,0 +1,25 @@
+from django.http import Http404
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app.middleware import get_stats, query_budget_enabled, reset_stats
+from app.utils.cache import get_content_cache
+
+
+class QueryStatsView(APIView):
+    """Per-route timings and content cache stats, for staff only."""
+
+    permission_classes = [IsAdminUser]
+
+    def initial(self, request, *args, **kwargs):
+        if not query_budget_enabled():
+            raise Http404
+        super().initial(request, *args, **kwargs)
+
+    def get(self, request):
+        return Response({'routes': get_stats(), 'content_cache': get_content_cache().stats()})
+
+    def delete(self, request):
+        reset_stats()
+        return Response(status=204)
@@ -1,11 +1,8 @@
-from rest_framework import viewsets
 from app.models.models import Footer
+from app.views.base import ContentViewSet
 from app.serializers.footer import FooterSerializer
 
-class FooterViewSet(viewsets.ModelViewSet):
+class FooterViewSet(ContentViewSet):
     queryset = Footer.objects.all()
+    query_budget = {'list': 2, 'retrieve': 2}
     serializer_class = FooterSerializer
-
-    def get_queryset(self):
-        user = self.request.user
-        return Footer.objects.all()  
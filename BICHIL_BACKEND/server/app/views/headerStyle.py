@@ -1,8 +1,10 @@
-from rest_framework import viewsets, filters
+from rest_framework import filters
+from app.views.base import ContentViewSet
 from app.models.models import HeaderStyle
 from app.serializers.headerStyle import HeaderStyleSerializer
 
-class HeaderStyleViewSet(viewsets.ModelViewSet):
+class HeaderStyleViewSet(ContentViewSet):
     queryset = HeaderStyle.objects.all()
+    query_budget = {'list': 1, 'retrieve': 1}
     serializer_class = HeaderStyleSerializer
 
@@ -1,10 +1,18 @@
-from rest_framework import viewsets, status
+from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from app.views.base import ContentViewSet
 from app.models.models import Header
+from app.navigation import NAVIGATION_MODELS, build_navigation, save_navigation
 from app.serializers.headers import HeaderSerializer, HeaderCreateUpdateSerializer
+from app.serializers.navigation import NavigationMenuSerializer
+from app.utils.cache import model_versions
+from app.utils.conditional import versioned_response
+from app.utils.language import negotiate_language
 
-class HeaderViewSet(viewsets.ModelViewSet):
+class HeaderViewSet(ContentViewSet):
     queryset = Header.objects.all()
+    query_budget = {'list': 8, 'retrieve': 8}
     
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -13,5 +21,22 @@ class HeaderViewSet(viewsets.ModelViewSet):
 
     def destroy(self, request, *args, **kwargs):
         header = self.get_object()
-        header.delete()
+        self.perform_destroy(header)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=['get', 'put'])
+    def navigation(self, request, pk=None):
+        header = self.get_object()
+        if request.method == 'PUT':
+            serializer = NavigationMenuSerializer(data=request.data, many=True)
+            serializer.is_valid(raise_exception=True)
+            save_navigation(header.pk, serializer.validated_data)
+            return Response(build_navigation(header.pk, hidden=True))
+
+        language = negotiate_language(request)
+        # ?hidden=1 also returns hidden nodes, for editing the whole tree.
+        hidden = request.query_params.get('hidden') in ('1', 'true')
+        return versioned_response(
+            request, 'navigation:%s:%s' % (header.pk, int(hidden)), language, model_versions(NAVIGATION_MODELS),
+            lambda: build_navigation(header.pk, language, hidden),
+        )
@@ -1,7 +1,8 @@
-from rest_framework import viewsets
+from app.views.base import ContentViewSet
 from app.models.models import HeaderMenu
 from app.serializers.headersMenu import HeaderMenuSerializer
 
-class HeaderMenuViewSet(viewsets.ModelViewSet):
+class HeaderMenuViewSet(ContentViewSet):
     queryset = HeaderMenu.objects.all()
+    query_budget = {'list': 2, 'retrieve': 2}
     serializer_class = HeaderMenuSerializer
@@ -1,8 +1,10 @@
-from rest_framework import viewsets, status
+from rest_framework import status
 from rest_framework.response import Response
+from app.views.base import ContentViewSet
 from app.models.models import HeaderSubmenu
 from app.serializers.headersSubmenu import HeaderSubmenuSerializer
 
-class HeaderSubmenuViewSet(viewsets.ModelViewSet):
+class HeaderSubmenuViewSet(ContentViewSet):
     queryset = HeaderSubmenu.objects.all()
+    query_budget = {'list': 2, 'retrieve': 2}
     serializer_class = HeaderSubmenuSerializer
@@ -1,7 +1,8 @@
-from rest_framework import viewsets
+from app.views.base import ContentViewSet
 from app.models.models import HeaderTertiaryMenu
 from app.serializers.headersTertiaryMenu import HeaderTertiaryMenuSerializer
 
-class HeaderTertiaryMenuViewSet(viewsets.ModelViewSet):
+class HeaderTertiaryMenuViewSet(ContentViewSet):
     queryset = HeaderTertiaryMenu.objects.all()
+    query_budget = {'list': 2, 'retrieve': 2}
     serializer_class = HeaderTertiaryMenuSerializer
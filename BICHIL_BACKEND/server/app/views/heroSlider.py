@@ -1,10 +1,9 @@
-from rest_framework.viewsets import ModelViewSet
-from rest_framework.filters import OrderingFilter
-
 from app.models.models import HeroSlider
+from app.views.base import ContentViewSet
 from app.serializers.heroSlider import HeroSliderSerializer
 
 
-class HeroSliderViewSet(ModelViewSet):
+class HeroSliderViewSet(ContentViewSet):
     queryset = HeroSlider.objects.all()
+    query_budget = {'list': 1, 'retrieve': 1}
     serializer_class = HeroSliderSerializer
@@ -0,0 +1,42 @@
+import mimetypes
+import os
+
+from django.http import Http404
+from django.views import View
+
+from app.media import DERIVATIVE_FORMATS, derivative_path, upload_path
+from app.utils.ranges import file_response
+
+CONTENT_TYPES = {'.%s' % extension: mime for _, extension, mime in DERIVATIVE_FORMATS}
+# Slides and CTAs are images or videos; nothing else in uploads/ is served.
+UPLOAD_TYPES = ('image/', 'video/')
+
+
+class MediaFileView(View):
+    """Content-hashed image derivatives generated by app.media."""
+
+    http_method_names = ['get', 'head']
+
+    def get(self, request, filename):
+        extension = os.path.splitext(filename)[1]
+        if os.path.basename(filename) != filename or extension not in CONTENT_TYPES:
+            raise Http404
+        return file_response(request, derivative_path(filename), CONTENT_TYPES[extension], immutable=True)
+
+
+class UploadFileView(View):
+    """Uploaded slider and CTA files, ``/uploads/<name>`` as ``/api/v1/media/uploads/<name>``.
+
+    Supports Range requests so browsers can seek and start video playback
+    without fetching the whole file. The admin names every upload
+    ``<timestamp>-<name>``, so a file under one URL never changes.
+    """
+
+    http_method_names = ['get', 'head']
+
+    def get(self, request, name):
+        path = upload_path(name)
+        content_type = mimetypes.guess_type(name)[0] or ''
+        if path is None or not content_type.startswith(UPLOAD_TYPES):
+            raise Http404
+        return file_response(request, path, content_type, immutable=True)
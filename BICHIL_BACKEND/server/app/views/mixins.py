@@ -0,0 +1,197 @@
+import time
+
+from django.shortcuts import get_object_or_404
+from rest_framework.response import Response
+
+from app.utils.cache import (
+    bump_content_version, cache_key, content_versions, dependent_models, get_content_cache,
+)
+from app.utils.conditional import (
+    conditional_response, payload_etag, set_validators, version_etag, version_last_modified,
+)
+from app.utils.language import add_language_vary, negotiate_language, negotiates_accept_language
+from app.utils.prefetch import apply_prefetch_plan
+from app.utils.values import build_values, supports_values_read, values_queryset, values_reads_enabled
+
+# Part of every read cache key; bump when the shape of cached entries changes.
+CACHE_ENTRY_FORMAT = 2
+
+
+class PrefetchMixin:
+    prefetch_actions = ('list', 'retrieve')
+
+    def get_prefetch_language(self):
+        return None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.prefetch_actions:
+            queryset = apply_prefetch_plan(
+                queryset, self.get_serializer_class(), self.get_prefetch_language()
+            )
+        return queryset
+
+
+class LanguageMixin:
+    """Limit read actions to the ?lang= (or Accept-Language) translation rows."""
+
+    def get_prefetch_language(self):
+        if not hasattr(self, '_language'):
+            self._language = negotiate_language(self.request, negotiates_accept_language())
+        return self._language
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if negotiates_accept_language():
+            add_language_vary(response)
+        return response
+
+
+class ValuesReadMixin:
+    """With ``FAST_READS``, build list/retrieve output from values() rows.
+
+    Only used when the read serializer has a values() equivalent; the output
+    is the same as the serializer's.
+    """
+
+    def use_values_read(self):
+        return values_reads_enabled() and supports_values_read(self.get_serializer_class())
+
+    def get_values_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.paginator
+        extra = paginator.get_key_fields(queryset) if hasattr(paginator, 'get_key_fields') else ()
+        return values_queryset(queryset, self.get_serializer_class(), extra)
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_values_read():
+            return super().list(request, *args, **kwargs)
+        queryset = self.get_values_queryset()
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = build_values(rows, self.get_serializer_class(), self.get_prefetch_language())
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.use_values_read():
+            return super().retrieve(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        # Public content reads: there are no object permissions to check.
+        row = get_object_or_404(self.get_values_queryset(), **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return Response(build_values([row], self.get_serializer_class(), self.get_prefetch_language())[0])
+
+
+class CachedReadMixin:
+    """Serve list/retrieve from the content cache.
+
+    Keys carry the current version of every content type the read serializer
+    touches, so any write to one of them makes old entries unreachable.
+    Entries hold the data and the next page cursor, so a cached page still
+    gets its ``Link`` header.
+    """
+
+    def get_content_versions(self):
+        if not hasattr(self, '_content_versions'):
+            self._content_versions = content_versions([self.get_serializer_class()])
+        return self._content_versions
+
+    def get_cache_key(self, request):
+        if hasattr(self, '_cache_key'):
+            return self._cache_key
+        language = self.get_prefetch_language()
+        self._cache_key = cache_key(
+            CACHE_ENTRY_FORMAT, self.basename, self.action, sorted(self.kwargs.items()),
+            sorted(request.query_params.lists()),
+            language.id if language is not None else None,
+            self.get_content_versions(),
+        )
+        return self._cache_key
+
+    def _cached_read(self, read, request, *args, **kwargs):
+        cache = get_content_cache()
+        key = self.get_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            data, next_cursor = entry
+            response = Response(data)
+            if next_cursor is not None:
+                self.paginator.set_next_link(response, request, next_cursor)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = read(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, (response.data, getattr(self.paginator, 'next_cursor', None)))
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_read(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_read(super().retrieve, request, *args, **kwargs)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        bump_content_version(type(instance), *dependent_models(type(instance)))
+
+
+class ConditionalGetMixin:
+    """Answer list/retrieve revalidations with 304 before any serialization.
+
+    The ETag is the versioned cache key, so it changes exactly when a write
+    touches one of the content types behind the response. Without shared
+    versions (see CONTENT_VERSIONS) it is a hash of the payload instead, which
+    is only known after the read.
+    """
+
+    def get_validators(self, request):
+        if not get_content_cache().versions_shared:
+            return None, None
+        return (
+            version_etag(self.get_cache_key(request)),
+            version_last_modified(self.get_content_versions()),
+        )
+
+    def _conditional_read(self, read, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        if etag is not None:
+            response = conditional_response(request, etag, last_modified)
+            if response is not None:
+                return response
+        response = read(request, *args, **kwargs)
+        if response.status_code == 200:
+            if etag is None:
+                etag = payload_etag(response.data)
+                not_modified = conditional_response(request, etag, None)
+                if not_modified is not None:
+                    return not_modified
+            set_validators(response, etag, last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional_read(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional_read(super().retrieve, request, *args, **kwargs)
+
+
+class QueryMetricsMixin:
+    """Attribute list/retrieve time not spent in the database to serialization."""
+
+    def _measured_read(self, read, request, *args, **kwargs):
+        metrics = getattr(request._request, 'query_metrics', None)
+        if metrics is None:
+            return read(request, *args, **kwargs)
+        db_time, start = metrics.db_time, time.perf_counter()
+        response = read(request, *args, **kwargs)
+        metrics.serializer_time += (time.perf_counter() - start) - (metrics.db_time - db_time)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._measured_read(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._measured_read(super().retrieve, request, *args, **kwargs)
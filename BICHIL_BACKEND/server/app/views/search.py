@@ -0,0 +1,23 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app.search import DEFAULT_LIMIT, MAX_LIMIT, get_search_index
+from app.utils.language import add_language_vary, negotiate_language
+
+
+class SearchView(APIView):
+    """Prefix and typo-tolerant search over category, product type and product labels."""
+
+    def get(self, request):
+        language = negotiate_language(request)
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_LIMIT))
+        except ValueError:
+            limit = DEFAULT_LIMIT
+        query = request.query_params.get('q', '')
+        results = get_search_index().search(query, language, max(1, min(limit, MAX_LIMIT)))
+        return add_language_vary(Response({
+            'query': query,
+            'language': language.lang_code if language is not None else None,
+            'results': results,
+        }))
@@ -0,0 +1,71 @@
+import os
+
+from django.http import FileResponse, Http404
+from django.utils.cache import patch_cache_control
+from django.views import View
+
+from app.publish import MANIFEST_NAME, current_manifest, snapshot_path, snapshot_root
+from app.utils.conditional import conditional_response, json_response, set_validators
+from app.utils.language import ALL_LANGUAGES, add_language_vary, parse_accept_language
+from app.utils.ranges import IMMUTABLE_MAX_AGE
+
+
+def _json_file(path):
+    try:
+        return FileResponse(open(path, 'rb'), content_type='application/json')
+    except FileNotFoundError:
+        raise Http404
+
+
+def _snapshot_language(request, languages):
+    """Negotiate against the languages in the manifest, without the ORM."""
+    lang_code = request.GET.get('lang')
+    if lang_code:
+        return lang_code.lower()
+    for tag in parse_accept_language(request.META.get('HTTP_ACCEPT_LANGUAGE', '')):
+        for candidate in (tag, tag.split('-')[0]):
+            if candidate in languages:
+                return candidate
+    return ALL_LANGUAGES
+
+
+class SnapshotManifestView(View):
+    http_method_names = ['get', 'head']
+
+    def get(self, request):
+        response = _json_file(os.path.join(snapshot_root(), MANIFEST_NAME))
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+class SnapshotView(View):
+    """Current published snapshot of one public read, served from disk."""
+
+    http_method_names = ['get', 'head']
+
+    def get(self, request, name):
+        manifest = current_manifest()
+        if manifest is None or name not in manifest['snapshots']:
+            raise Http404
+        languages = manifest['snapshots'][name]
+        lang_code = _snapshot_language(request, languages)
+        if lang_code not in languages:
+            return json_response({'lang': ['Unknown language "%s".' % request.GET.get('lang')]}, status=400)
+
+        entry = languages[lang_code]
+        etag, last_modified = '"%s"' % entry['etag'], manifest['published'] // 1000
+        response = conditional_response(request, etag, last_modified)
+        if response is None:
+            response = set_validators(_json_file(snapshot_path(entry['file'])), etag, last_modified)
+        return add_language_vary(response)
+
+
+class SnapshotFileView(View):
+    http_method_names = ['get', 'head']
+
+    def get(self, request, filename):
+        if os.path.basename(filename) != filename or not filename.endswith('.json'):
+            raise Http404
+        response = _json_file(snapshot_path(filename))
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+        return response
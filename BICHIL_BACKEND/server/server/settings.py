@@ -47,10 +47,13 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'app.middleware.QueryBudgetMiddleware',
+    'app.middleware.ReadReplicaMiddleware',
 ]
 
 ROOT_URLCONF = 'server.urls'
@@ -87,6 +90,17 @@ DATABASES = {
     }
 }
 
+# Read replicas: add each as a DATABASES alias and list it in READ_REPLICAS.
+# Content reads of GET requests then go to a replica, except for models
+# written within READ_STICKY_SECONDS and for clients that wrote within that
+# window. A replica that refuses connections is skipped for
+# READ_REPLICA_RETRY_SECONDS. For tests against two local databases, give
+# the replica alias 'TEST': {'MIRROR': 'default'}.
+DATABASE_ROUTERS = ['app.routers.ReadReplicaRouter']
+READ_REPLICAS = []
+READ_STICKY_SECONDS = 5
+READ_REPLICA_RETRY_SECONDS = 30
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -109,6 +123,20 @@ AUTH_PASSWORD_VALIDATORS = [
 
 CORS_ALLOW_ALL_ORIGINS = True
 
+CORS_EXPOSE_HEADERS = ['ETag', 'Link']
+
+REST_FRAMEWORK = {
+    'DEFAULT_PAGINATION_CLASS': 'app.pagination.KeysetPagination',
+    'PAGE_SIZE': 100,
+    'DEFAULT_RENDERER_CLASSES': [
+        'app.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# Hard upper bound on the rows of one list response, with or without ?page_size=.
+MAX_PAGE_SIZE = 500
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -125,3 +153,59 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
+
+# Versioned cache in front of content reads. Use
+# 'app.utils.cache.FileContentCache' with OPTIONS['location'] to share
+# entries between workers on one host.
+CONTENT_CACHE = {
+    'BACKEND': 'app.utils.cache.LocMemContentCache',
+    'OPTIONS': {
+        'max_entries': 1000,
+        'max_bytes': 64 * 1024 * 1024,
+    },
+}
+
+# Content versions key the cache and ETags. DatabaseVersions keeps them in
+# the content_version table (admin/migrations/003_content_versions.sql), so
+# every worker sees every write and versions survive restarts; each process
+# re-reads them at most every 'ttl' seconds. None keeps them in the
+# CONTENT_CACHE backend (per process for LocMemContentCache).
+CONTENT_VERSIONS = {
+    'BACKEND': 'app.utils.cache.DatabaseVersions',
+    'OPTIONS': {'ttl': 1.0},
+}
+
+# Apply Accept-Language to the router endpoints when no ?lang= is given.
+# /api/v1/bootstrap/ always negotiates.
+NEGOTIATE_CONTENT_LANGUAGE = False
+
+# Per-route query/timing instrumentation, X-Query-Count/Server-Timing headers
+# and /api/v1/debug/query-stats/.
+QUERY_BUDGET_ENABLED = False
+
+# Publish-time JSON snapshots served from /api/v1/snapshots/ without the ORM.
+# With PUBLISH_SNAPSHOTS every content write queues a background republish
+# on commit; writes within PUBLISH_DELAY_SECONDS share one publish.
+# `manage.py publish_snapshots` rebuilds them by hand.
+SNAPSHOT_ROOT = BASE_DIR / 'snapshots'
+PUBLISH_SNAPSHOTS = False
+PUBLISH_DELAY_SECONDS = 1.0
+
+# Build list/retrieve/bootstrap output from values() rows instead of model
+# instances and serializer fields. `manage.py check_read_parity` compares both.
+FAST_READS = False
+
+# Resized AVIF/WebP/JPEG variants of HeroSlider, CTA and AppDownload images
+# (requires Pillow), exposed as `srcset` and served from /api/v1/media/.
+# Uploads are read from MEDIA_SOURCE_ROOT (the admin app's public/ directory)
+# and generated on write or first read by MEDIA_WORKERS background threads;
+# `manage.py generate_derivatives` backfills existing images.
+MEDIA_DERIVATIVES = False
+MEDIA_SOURCE_ROOT = BASE_DIR.parent.parent / 'admin' / 'public'
+MEDIA_DERIVATIVES_ROOT = BASE_DIR / 'media' / 'derivatives'
+MEDIA_DERIVATIVES_URL = '/api/v1/media/'
+MEDIA_WORKERS = 2
+
+# Languages are cached per process (app.utils.language.LanguageRegistry) and
+# reloaded after this many seconds, on a lookup miss or when saved here.
+LANGUAGE_REGISTRY_TTL = 60
@@ -0,0 +1,16 @@
+-- Range predicates and sort keys of the product finder
+-- (app/categories/finder.py). Each sort order can walk its own index and
+-- stop after the requested number of products.
+CREATE INDEX IF NOT EXISTS idx_product_details_rate ON product_details (min_interest_rate, id);
+CREATE INDEX IF NOT EXISTS idx_product_details_fee ON product_details (min_fee_percent, id);
+CREATE INDEX IF NOT EXISTS idx_product_details_amount ON product_details (amount DESC NULLS LAST, id);
+CREATE INDEX IF NOT EXISTS idx_product_details_term ON product_details (term_months DESC NULLS LAST, id);
+CREATE INDEX IF NOT EXISTS idx_product_details_processing ON product_details (min_processing_hours, id);
+CREATE INDEX IF NOT EXISTS idx_product_details_product ON product_details (product);
+
+-- Joins to the product tree and the translation lookups.
+CREATE INDEX IF NOT EXISTS idx_product_product_type ON product (product_type);
+CREATE INDEX IF NOT EXISTS idx_product_type_category ON product_type (category);
+CREATE INDEX IF NOT EXISTS idx_product_translations_product ON product_translations (product, language);
+CREATE INDEX IF NOT EXISTS idx_product_type_translations_product_type ON product_type_translations (product_type, language);
+CREATE INDEX IF NOT EXISTS idx_category_translations_category ON category_translations (category, language);
@@ -0,0 +1,7 @@
+-- Content versions of the API's read cache, one row per content type
+-- (Django model label). Every worker reads them, so a write in one worker
+-- invalidates cached reads and ETags in all of them, across restarts.
+CREATE TABLE IF NOT EXISTS content_version (
+  name TEXT PRIMARY KEY,
+  version BIGINT NOT NULL
+);